@@ -2,6 +2,7 @@ from .fields import Field, FieldInfo
 from .relationships import Relationship, RelationshipType
 from .model import NexiosModel
 from .query.builder import Select
+from .query.expressions import bindparam
 
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "Relationship",
     "RelationshipType",
     "NexiosModel",
-    "Select"
+    "Select",
+    "bindparam",
 ]
\ No newline at end of file
@@ -8,8 +8,10 @@ from abc import ABC, abstractmethod
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from enum import Enum, StrEnum
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 from pathlib import Path
+from types import UnionType
 from typing import (
     Annotated,
     Any,
@@ -22,6 +24,7 @@ from typing import (
     get_args,
     get_origin,
     Callable,
+    Hashable,
 )
 from urllib.parse import urlparse
 from uuid import UUID
@@ -284,6 +287,43 @@ class MySQLDialect(Dialect):
         return ""
 
 
+@lru_cache(maxsize=256)
+def _unwrap_column_type(annotation: Any) -> Any:
+    """Strip Annotated/Optional wrappers; the same annotations recur across models."""
+    while True:
+        origin = get_origin(annotation)
+        if origin is None:
+            break
+
+        args = get_args(annotation)
+
+        # Annotated[T, ...]
+        if origin is Annotated:
+            annotation = args[0]
+            continue
+
+        # Optional / Union[T, None] / T | None
+        if origin is Union or origin is UnionType:
+            non_none = [arg for arg in args if arg is not type(None)]
+            annotation = non_none[0] if non_none else str
+            continue
+
+        break
+
+    return annotation
+
+
+@lru_cache(maxsize=256)
+def _get_type_mapping(
+    dialect: Dialect,
+    max_digits: Optional[int],
+    precision: Optional[int],
+    scale: Optional[int],
+) -> Dict[type, str]:
+    """Memoized ``dialect.get_type_mapping``; the result must be treated as read-only."""
+    return dialect.get_type_mapping(max_digits, precision, scale)
+
+
 def is_true(attr_value):
     return attr_value is not Undefined and bool(attr_value)
 
@@ -300,6 +340,7 @@ def _normalize_driver(driver: Any):
 
     return driver
 
+@lru_cache(maxsize=256)
 def get_param_placeholder(
     driver: str, index: int = 1, name: Optional[str] = None
 ) -> str:
@@ -341,12 +382,15 @@ def get_param_placeholder(
         return "?"
 
 
+@lru_cache(maxsize=256)
 def generate_placeholders(driver: str, count, start_index: int = 1):
+    # The result only depends on the driver and the slot range, so each
+    # (driver, count, start) combination is joined once and reused
     driver = _normalize_driver(driver)
-    placeholders = []
-    for i in range(count):
-        placeholders.append(get_param_placeholder(driver=driver, index=start_index + i))
-    return ", ".join(placeholders)
+    return ", ".join(
+        get_param_placeholder(driver=driver, index=index)
+        for index in range(start_index, start_index + count)
+    )
 
 
 class DDLGenerator:
@@ -360,18 +404,33 @@ class DDLGenerator:
         if not isinstance(model_class, type):
             model_class = model_class.__class__
 
-        tbname = getattr(model_class, "__tablename__", None)
-
-        if tbname is None and hasattr(model_class, "__tablename__"):
-            tbname = model_class.__tablename__
-
-        return tbname if tbname else ""
+        return getattr(model_class, "__tablename__", None) or ""
 
     def _get_primary_key(self, model_class: NexiosModel) -> Any:
         return model_class.get_primary_key()
 
+    def _cached_sql(
+        self, model_class: InstanceOrType[NexiosModel], kind: Hashable, build: Callable[[], Any]
+    ) -> Any:
+        """Return SQL that only depends on the model and dialect, building it once."""
+        cache = getattr(model_class, "__sql_cache__", None)
+        if cache is None:
+            return build()
+
+        key = (type(self.dialect), self.driver, kind)
+        try:
+            return cache[key]
+        except KeyError:
+            sql = cache[key] = build()
+            return sql
+
     def create_table(self, model_class: Type[NexiosModel]) -> str:
         """Generate CREATE TABLE statements"""
+        return self._cached_sql(
+            model_class, "create_table", lambda: self._create_table(model_class)
+        )
+
+    def _create_table(self, model_class: Type[NexiosModel]) -> str:
         table_name = self._get_tablename(model_class)
         columns = self._get_column_definitions(model_class)
         constraints = self._get_table_constraints(model_class)
@@ -387,7 +446,6 @@ class DDLGenerator:
         """
         from nexios.orm.query.expressions import ColumnExpression, BinaryExpression
 
-        tablename = self._get_tablename(model_class)
         primary_key = self._get_primary_key(model_class)
 
         if isinstance(primary_key, ColumnExpression):
@@ -399,14 +457,17 @@ class DDLGenerator:
 
         if primary_key_value is None:
             raise ValueError(
-                f"Cannot delete {model_class.__name__} with null primary key"
+                f"Cannot delete {type(model_class).__name__} with null primary key"
             )
 
-        col_expr = ColumnExpression(model_class.__class__, primary_key_field)
-        condition = BinaryExpression(col_expr, "=", primary_key_value)
-        sql_condition, params = condition.to_sql(get_param_placeholder(self.driver))
-        sql = f"DELETE FROM {self.dialect.quote_identifier(tablename)} WHERE {sql_condition}"
-        return sql, tuple(params)
+        def build() -> str:
+            tablename = self._get_tablename(model_class)
+            col_expr = ColumnExpression(model_class.__class__, primary_key_field)
+            condition = BinaryExpression(col_expr, "=", primary_key_value)
+            sql_condition, _ = condition.to_sql(get_param_placeholder(self.driver))
+            return f"DELETE FROM {self.dialect.quote_identifier(tablename)} WHERE {sql_condition}"
+
+        return self._cached_sql(model_class, "delete", build), (primary_key_value,)
 
     def upsert(self, model_class: NexiosModel) -> Tuple[str, tuple]:
         """Insert or update statement"""
@@ -422,11 +483,25 @@ class DDLGenerator:
 
     def drop_table(self, model_class: Type[NexiosModel]) -> str:
         """Generate DROP TABLE statement"""
+        return self._cached_sql(
+            model_class, "drop_table", lambda: self._drop_table(model_class)
+        )
+
+    def _drop_table(self, model_class: Type[NexiosModel]) -> str:
         table_name = self._get_tablename(model_class)
         return f"DROP TABLE IF EXISTS {self.dialect.quote_identifier(table_name)};"
 
     def create_indexes(self, model_class: Type[NexiosModel]) -> List[str]:
         """Generate CREATE INDEX statements"""
+        return list(
+            self._cached_sql(
+                model_class,
+                "create_indexes",
+                lambda: tuple(self._create_indexes(model_class)),
+            )
+        )
+
+    def _create_indexes(self, model_class: Type[NexiosModel]) -> List[str]:
         indexes = []
         table_name = self._get_tablename(model_class)
 
@@ -442,7 +517,7 @@ class DDLGenerator:
             else:
                 index_field = index
 
-            if is_true(index_field) and not field_info.unique:
+            if is_true(index_field) and not getattr(field_info, "unique", Undefined):
                 index_name = f"idx_{table_name}_{field_name}"
                 indexes.append(
                     f"CREATE INDEX {self.dialect.quote_identifier(index_name)} "
@@ -457,7 +532,6 @@ class DDLGenerator:
         from nexios.orm.query.expressions import ColumnExpression
 
         model_class = model_instance.__class__
-        fields_to_save: Dict[str, Any] = {}
         tablename = self._get_tablename(model_class)
         fields = model_instance.get_fields()
 
@@ -467,32 +541,47 @@ class DDLGenerator:
         else:
             primary_key_field = primary_key
 
-        for field_name, field_info in fields.items():
-            value = getattr(model_instance, field_name, None)
-
-            auto_increment = getattr(field_info, "auto_increment", False)
-            is_primary_key = is_true(primary_key)
-
-            if is_primary_key and auto_increment:
-                if value is None or isinstance(value, int) and value <= 0:
-                    continue  # Let database generate the auto_increment
-
-                else:
-                    fields_to_save[field_name] = value
-                    continue
+        # Collect names and values in one pass so each field is read once
+        field_names: List[str] = []
+        values: List[Any] = []
+        auto_fields = (
+            model_class.__auto_increment_fields__ if is_true(primary_key) else ()
+        )
+        for field_name, value in model_instance.get_field_values().items():
+            if value is None:
+                continue
+            if field_name in auto_fields and isinstance(value, int) and value <= 0:
+                continue  # Let database generate the auto_increment
+
+            field_names.append(field_name)
+            values.append(value)
+
+        # Only the set of populated columns varies between rows, so the
+        # statement text is cached per column tuple
+        sql, returning_clause = self._cached_sql(
+            model_class,
+            ("insert", tuple(field_names)),
+            lambda: self._build_insert(
+                tablename, field_names, fields.get(primary_key_field), primary_key_field
+            ),
+        )
 
-            if value is not None:
-                fields_to_save[field_name] = value
+        params = tuple(values)
 
-        field_names = list(fields_to_save.keys())
-        field_count = len(field_names)
+        return sql, params, returning_clause
 
-        placeholders = generate_placeholders(self.driver, field_count, 1)
+    def _build_insert(
+        self,
+        tablename: str,
+        field_names: List[str],
+        primary_key_info: Any,
+        primary_key_field: Any,
+    ) -> Tuple[str, str]:
+        placeholders = generate_placeholders(self.driver, len(field_names), 1)
         field_names_str = ", ".join(field_names)
         sql = f"INSERT INTO {self.dialect.quote_identifier(tablename)} ({field_names_str}) VALUES ({placeholders})"
 
-        field_info = fields.get(primary_key_field)
-        auto_increment = getattr(field_info, "auto_increment", False)
+        auto_increment = getattr(primary_key_info, "auto_increment", False)
 
         returning_clause = ""
 
@@ -501,11 +590,14 @@ class DDLGenerator:
                 primary_key_field
             )
 
-        params = tuple(getattr(model_instance, fname) for fname in field_names)
+        return sql, returning_clause
 
-        return sql, params, returning_clause
+    def _update(self, model_instance: NexiosModel) -> str:
+        return self._cached_sql(
+            model_instance, "upsert_conflict", lambda: self._build_update(model_instance)
+        )
 
-    def _update(self, model_instance: NexiosModel):
+    def _build_update(self, model_instance: NexiosModel) -> str:
         fields = model_instance.get_fields()
         primary_key = self._get_primary_key(model_instance)
 
@@ -581,7 +673,10 @@ class DDLGenerator:
         if is_primary_key:
             parts.append("PRIMARY KEY")
 
-        if field_info.auto_increment and field_info.primary_key:
+        # Bare annotations carry pydantic's FieldInfo without the ORM attributes
+        if getattr(field_info, "auto_increment", False) and getattr(
+            field_info, "primary_key", Undefined
+        ):
             if db_type.upper() in ("INTEGER", "INT", "BIGINT", "SMALLINT"):
                 parts.append(self.dialect.auto_increment_keyword())
             elif db_type.upper() in ("SERIAL", "BIGSERIAL"):
@@ -623,24 +718,11 @@ class DDLGenerator:
     def _get_field_type(self, model_class: Type[NexiosModel], field_name: str) -> type:
         """Get the python type for a field"""
         annotation = model_class.__annotations__.get(field_name, str)
-
-        while True:
-            origin = get_origin(annotation)
-
-            # Annotated[T, ...]
-            if origin is Annotated:
-                annotation = get_args(annotation)[0]
-                continue
-
-            # Optional / Union[T, None]
-            if origin is Union:
-                args = [arg for arg in get_args(annotation) if arg is not type(None)]
-                annotation = args[0] if args else str
-                continue
-
-            break
-
-        return annotation
+        try:
+            return _unwrap_column_type(annotation)
+        except TypeError:
+            # Unhashable Annotated metadata; unwrap without the memo
+            return _unwrap_column_type.__wrapped__(annotation)
 
     def _map_python_type(
         self,
@@ -650,10 +732,11 @@ class DDLGenerator:
         scale: Optional[int] = None,
     ) -> str:
         """Map python type to database type"""
-        type_mapping = self.dialect.get_type_mapping(max_digits, precision, scale)
+        type_mapping = _get_type_mapping(self.dialect, max_digits, precision, scale)
 
-        if python_type in type_mapping:
-            return type_mapping[python_type]
+        db_type = type_mapping.get(python_type)
+        if db_type is not None:
+            return db_type
 
         # Enum subclasses
         if inspect.isclass(python_type) and issubclass(python_type, Enum):
@@ -793,28 +876,13 @@ class DDLGenerator:
         """Convert a model name to its table name"""
         # Look in the model registry
         if hasattr(source_model, "__registry__"):
-            registry = source_model.__registry__
-            for model_cls in registry.values():
-                if model_cls.__name__.lower() == model_name_lower:
-                    return model_cls.__tablename__
-
-        # Also check if we have the model directly
-        if hasattr(source_model, "__relationships__"):
-            for rel_info in source_model.__relationships__.values():
-                if (
-                    rel_info.related_model_name
-                    and rel_info.related_model_name.lower() == model_name_lower
-                ):
-                    # Try to get the actual model
-                    try:
-                        model_cls = source_model.__registry__.get(
-                            rel_info.related_model_name
-                        )
-                        # model_cls = registry.get(rel_info.related_model_name)
-                        if model_cls:
-                            return model_cls.__tablename__
-                    except Exception:
-                        pass
+            model_cls = source_model.__registry_by_name__.get(model_name_lower)
+            if model_cls is not None:
+                return model_cls.__tablename__
+            # Foreign keys may name the table rather than the model
+            model_cls = source_model.__registry_by_table__.get(model_name_lower)
+            if model_cls is not None:
+                return model_cls.__tablename__
 
         return None
 
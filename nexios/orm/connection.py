@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, List
+from contextlib import nullcontext
+from typing import Any, ContextManager, AsyncContextManager, Optional, Tuple, List
 
 
 class SyncQueryResult:
@@ -83,6 +84,19 @@ class SyncDatabaseConnection(ABC):
     @abstractmethod
     def cursor(self) -> SyncCursor: ...
 
+    def default_cursor(self) -> SyncCursor:
+        """Cursor kept for the connection's lifetime and reused by every
+        session that checks the connection out of the pool."""
+        cursor = getattr(self, "_default_cursor", None)
+        if cursor is None:
+            cursor = self._default_cursor = self.cursor()
+        return cursor
+
+    def pipeline(self) -> ContextManager[Any]:
+        """Context in which statements may be sent without waiting for each
+        result. Drivers without pipelining run them one by one."""
+        return nullcontext()
+
     @abstractmethod
     def commit(self) -> None: ...
 
@@ -104,6 +118,19 @@ class AsyncDatabaseConnection(ABC):
     @abstractmethod
     async def cursor(self) -> AsyncCursor: ...
 
+    async def default_cursor(self) -> AsyncCursor:
+        """Cursor kept for the connection's lifetime and reused by every
+        session that checks the connection out of the pool."""
+        cursor = getattr(self, "_default_cursor", None)
+        if cursor is None:
+            cursor = self._default_cursor = await self.cursor()
+        return cursor
+
+    def pipeline(self) -> AsyncContextManager[Any]:
+        """Context in which statements may be sent without waiting for each
+        result. Drivers without pipelining run them one by one."""
+        return nullcontext()
+
     @abstractmethod
     async def commit(self) -> None: ...
 
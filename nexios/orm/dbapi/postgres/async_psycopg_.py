@@ -1,4 +1,5 @@
-from typing import Any, List, Optional, Tuple, cast, LiteralString
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, List, Optional, Tuple, cast, LiteralString
 
 import psycopg
 
@@ -53,6 +54,11 @@ class AsyncPsycopgConnection(AsyncDatabaseConnection):
 
     async def rollback(self) -> None:
         await self._connection.rollback()
+
+    def pipeline(self) -> AsyncContextManager[Any]:
+        if psycopg.AsyncPipeline.is_supported():
+            return self._connection.pipeline()
+        return nullcontext()
     
     async def close(self) -> None:
         await self._connection.close()
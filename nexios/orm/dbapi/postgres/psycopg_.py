@@ -1,4 +1,5 @@
-from typing import Any, Tuple, List, Optional, LiteralString, cast
+from contextlib import nullcontext
+from typing import Any, ContextManager, Tuple, List, Optional, LiteralString, cast
 
 import psycopg
 
@@ -53,6 +54,11 @@ class PsycopgConnection(SyncDatabaseConnection):
 
     def rollback(self) -> None:
         self._connection.rollback()
+
+    def pipeline(self) -> ContextManager[Any]:
+        if psycopg.Pipeline.is_supported():
+            return self._connection.pipeline()
+        return nullcontext()
     
     def close(self) -> None:
         self._connection.close()
@@ -2,23 +2,24 @@ from __future__ import annotations
 
 import types
 
-from typing import Type, Optional, Any, List, overload, cast, TYPE_CHECKING
+from typing import Type, Optional, Any, Dict, List, Tuple, overload, cast, TYPE_CHECKING
 from pydantic_core import PydanticUndefined as Undefined
 
 from nexios.orm.relationships import RelationshipInfo, RelationshipType
-from nexios.orm.misc.context import get_context_data
+from nexios.orm.misc.context import context_data
 
 if TYPE_CHECKING:
     from nexios.orm.model import NexiosModel
     from nexios.orm import Select
     from nexios.orm.utils import (
         to_snake_case,
-        get_tablename_for_class,
         InstanceOrType,
     )
 
 
 _NOT_LOADED = object()
+# Shared with the sessions module, which sets it on enter
+_session_context = context_data("session")
 
 
 class ColumnDescriptor:
@@ -27,12 +28,19 @@ class ColumnDescriptor:
     def __init__(self, field_name: str, model_class: Type[NexiosModel]) -> None:
         self.field_name = field_name
         self.model_class = model_class
+        self._expression = None
 
     def __get__(self, instance, owner):
-        from nexios.orm.query.expressions import ColumnExpression
-
         if instance is None:
-            return ColumnExpression(self.model_class, self.field_name)
+            # One ColumnExpression per (model, field); built on first access
+            expression = self._expression
+            if expression is None:
+                from nexios.orm.query.expressions import ColumnExpression
+
+                expression = self._expression = ColumnExpression(
+                    self.model_class, self.field_name
+                )
+            return expression
         return instance.__dict__.get(self.field_name, None)
 
     def __set__(self, instance, value):
@@ -52,6 +60,12 @@ class RelationshipDescriptor:
     ) -> types.NoneType:
         self.model_class = model_class
         self.field_name = field_name
+        # (related, current) model pair -> foreign-key column; both field
+        # sets are fixed once the classes exist
+        self._fk_cache: Dict[Tuple[type, type], str] = {}
+        # Descriptor named by back_populates, linked by the metaclass once
+        # the related model is registered
+        self._back_descriptor: Optional[RelationshipDescriptor] = None
 
         if relationship_info is not None:
             self._relationship_info = relationship_info
@@ -66,7 +80,7 @@ class RelationshipDescriptor:
         if cached is not _NOT_LOADED:
             return cached
 
-        session = get_context_data("session")
+        session = _session_context.get()
         if not session:
             raise RuntimeError(
                 f"No session available for loading relationship '{self.field_name}'. "
@@ -101,29 +115,41 @@ class RelationshipDescriptor:
                     setattr(obj, fk_field, None)
             return
 
+        # The foreign-key lookup may find the column on the related side;
+        # only sync it here when it is one of our own fields
         local_fk = self._relationship_info.foreign_key or self._find_local_foreign_key()
-        if local_fk:
+        if local_fk and local_fk in obj.model_fields and not isinstance(value, list):
             pk_val = getattr(value, self._get_pk_field(value), None)
             setattr(obj, local_fk, pk_val)
 
         if self._relationship_info.back_populates:
             back_field = self._relationship_info.back_populates
-
-            if hasattr(value.__class__, back_field):
-                back_desc = getattr(value.__class__, back_field, None)
-
-                if isinstance(back_desc, RelationshipDescriptor):
-                    back_desc._set_cache(value, obj)
-                    remote_fk = (
-                        back_desc._relationship_info.foreign_key
-                        or back_desc._find_local_foreign_key()
-                    )
-                    if remote_fk:
-                        obj_pk_name = self._get_pk_field(obj)
-                        obj_pk_value = getattr(obj, obj_pk_name, None)
-                        setattr(value, remote_fk, obj_pk_value)
-                else:
-                    setattr(value, back_field, obj)
+            for related in value if isinstance(value, list) else (value,):
+                self._populate_back(obj, related, back_field)
+
+    def _pydantic_setattr(self, obj: NexiosModel, name: str, value: Any) -> None:
+        """Adapter for pydantic's memoized ``(model, name, value)`` setattr handlers."""
+        self.__set__(obj, value)
+
+    def _populate_back(self, obj: NexiosModel, related: Any, back_field: str) -> None:
+        back_desc = self._back_descriptor
+        if back_desc is None or not isinstance(related, back_desc.model_class):
+            if not hasattr(related.__class__, back_field):
+                return
+            back_desc = getattr(related.__class__, back_field, None)
+
+        if isinstance(back_desc, RelationshipDescriptor):
+            back_desc._set_cache(related, obj)
+            remote_fk = (
+                back_desc._relationship_info.foreign_key
+                or back_desc._find_local_foreign_key()
+            )
+            if remote_fk and remote_fk in related.model_fields:
+                obj_pk_name = self._get_pk_field(obj)
+                obj_pk_value = getattr(obj, obj_pk_name, None)
+                setattr(related, remote_fk, obj_pk_value)
+        else:
+            setattr(related, back_field, obj)
 
     def _find_local_foreign_key(self) -> Optional[str]:
         related_model = self._relationship_info.related_model
@@ -150,20 +176,35 @@ class RelationshipDescriptor:
 
     def _get_pk_field(self, model: InstanceOrType[NexiosModel]) -> Any:
         """Helper to safely get primary key."""
-        pk = model.get_primary_key()
-        return pk[0] if isinstance(pk, (list, tuple)) else pk
+        return model.__pk_field__
 
     def _find_foreign_key_on_related(
         self, related_model: Type[NexiosModel], current_model_class: Type[NexiosModel]
     ) -> str:
         """Find foreign key on related model that points to current model"""
-        from nexios.orm.utils import to_snake_case, get_model_fields, get_tablename_for_class
+        key = (related_model, current_model_class)
+        fk_field = self._fk_cache.get(key)
+        if fk_field is None:
+            fk_field = self._fk_cache[key] = self._scan_foreign_key_on_related(
+                related_model, current_model_class
+            )
+        return fk_field
+
+    def _scan_foreign_key_on_related(
+        self, related_model: Type[NexiosModel], current_model_class: Type[NexiosModel]
+    ) -> str:
+        from nexios.orm.utils import to_snake_case, get_model_fields
 
 
         # For one-to-one, the foreign key could be on either side
         # Check if current model has a field that points to related model first
         current_fields = get_model_fields(current_model_class)
         expected_name = f"{to_snake_case(related_model.__name__)}_id"
+        related_candidates = {
+            related_model.__name__.lower(),
+            to_snake_case(related_model.__name__),
+            (related_model.__tablename__ or "").lower(),
+        }
 
         # Check if foreign key exists on current model pointing to related
         for field_name, field_info in current_fields.items():
@@ -173,16 +214,7 @@ class RelationshipDescriptor:
                     fk_s = fk.strip()
                     if "." in fk_s:
                         left, _ = fk_s.rsplit(".", 1)
-                        left_l = left.lower()
-                        tablename = (
-                            get_tablename_for_class(related_model) or ""
-                        ).lower()
-                        candidates = {
-                            related_model.__name__.lower(),
-                            to_snake_case(related_model.__name__),
-                            tablename,
-                        }
-                        if left_l in candidates:
+                        if left.lower() in related_candidates:
                             return field_name
                     else:
                         if fk_s == expected_name or fk_s == field_name:
@@ -192,6 +224,11 @@ class RelationshipDescriptor:
         expected_name_on_related = f"{to_snake_case(current_model_class.__name__)}_id"
         pk_name = self._get_pk_field(current_model_class)
         related_fields = get_model_fields(related_model)
+        current_candidates = {
+            current_model_class.__name__.lower(),
+            to_snake_case(current_model_class.__name__),
+            (current_model_class.__tablename__ or "").lower(),
+        }
 
         # Check explicit foreign key metadata first
         for field_name, field_info in related_fields.items():
@@ -201,16 +238,7 @@ class RelationshipDescriptor:
                     fk_s = fk.strip()
                     if "." in fk_s:
                         left, _ = fk_s.rsplit(".", 1)
-                        left_l = left.lower()
-                        tablename = (
-                            get_tablename_for_class(current_model_class) or ""
-                        ).lower()
-                        candidates = {
-                            current_model_class.__name__.lower(),
-                            to_snake_case(current_model_class.__name__),
-                            tablename,
-                        }
-                        if left_l in candidates:
+                        if left.lower() in current_candidates:
                             return field_name
                     else:
                         if (
@@ -346,7 +374,6 @@ class RelationshipDescriptor:
         from nexios.orm.sessions import AsyncSession
 
         cached = self._get_cache(obj)
-        print(f"Cached data: {cached}")
         if cached is not _NOT_LOADED:
             return cached
 
@@ -17,6 +17,23 @@ from pydantic.fields import FieldInfo as PydanticFieldInfo
 
 from nexios.orm.utils import OnDeleteOrUpdate
 
+# Validation constraints forwarded to pydantic only when they are set
+_CONSTRAINT_KEYS = (
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "multiple_of",
+    "max_digits",
+    "decimal_places",
+    "min_items",
+    "max_items",
+    "unique_items",
+    "min_length",
+    "max_length",
+    "regex",
+)
+
 
 class FieldInfo(PydanticFieldInfo):
     def __init__(self, default: Any = Undefined, **kwargs: Any) -> None:
@@ -149,6 +166,28 @@ def Field(
 ) -> Any:
     current_schema_extra = schema_extra or {}
 
+    constraints = {}
+    for key, value in zip(
+        _CONSTRAINT_KEYS,
+        (
+            gt,
+            ge,
+            lt,
+            le,
+            multiple_of,
+            max_digits,
+            decimal_places,
+            min_items,
+            max_items,
+            unique_items,
+            min_length,
+            max_length,
+            regex,
+        ),
+    ):
+        if value is not None:
+            constraints[key] = value
+
     field_info = FieldInfo(
         default,
         default_factory=default_factory,
@@ -156,20 +195,7 @@ def Field(
         title=title,
         description=description,
         const=const,
-        gt=gt,
-        ge=ge,
-        lt=lt,
-        le=le,
-        multiple_of=multiple_of,
-        max_digits=max_digits,
-        decimal_places=decimal_places,
-        min_items=min_items,
-        max_items=max_items,
-        unique_items=unique_items,
-        min_length=min_length,
-        max_length=max_length,
         allow_mutation=allow_mutation,
-        regex=regex,
         discriminator=discriminator,
         repr=repr,
         primary_key=primary_key,
@@ -180,6 +206,7 @@ def Field(
         unique=unique,
         nullable=nullable,
         index=index,
+        **constraints,
         **current_schema_extra,
     )
     return field_info
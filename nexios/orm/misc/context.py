@@ -29,17 +29,20 @@ class _ContextCache:
         self._cache: Dict[Any, ContextData] = {}
 
     def get_or_create(self, key: Any, name: Optional[str] = None, default: Optional[Any] = None) -> ContextData:
-        if key not in self._cache:
-            if name is None:
-                name = f"context_data_{id(key)}"
-            self._cache[key] = ContextData(name, default)
-            _context_registry[name] = self._cache[key]
-        return self._cache[key]
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if name is None:
+            name = f"context_data_{id(key)}"
+        data = self._cache[key] = ContextData(name, default)
+        _context_registry[name] = data
+        return data
 
 _cache = _ContextCache()
 
 def context_data(key: Any, default: Optional[Any] = None, name: Optional[str] = None) -> ContextData:
-    return _cache.get_or_create(key, default, name)
+    return _cache.get_or_create(key, name, default)
 
 def get_context_data(key: Any):
     data = context_data(key)
@@ -3,18 +3,48 @@ from __future__ import annotations
 import sys
 import builtins
 import re
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
     List,
     ForwardRef,
+    get_args,
     get_type_hints,
 )
 
+
+@lru_cache(maxsize=None)
+def _base_global_namespace() -> Dict[str, Any]:
+    # builtins/typing/typing_extensions never change at runtime, so merge
+    # them once instead of on every class that needs resolving
+    import typing
+
+    namespace = {**builtins.__dict__, **typing.__dict__}
+    try:
+        import typing_extensions
+
+        namespace.update(typing_extensions.__dict__)
+    except ImportError:
+        pass
+    return namespace
+
+
+def _has_forward_ref(annotation: Any) -> bool:
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    return any(_has_forward_ref(arg) for arg in get_args(annotation))
+
+
 class ResolveForwardRefs:
 
     @classmethod
     def resolve_forward_references(cls):
+        # Nothing to resolve: skip building namespaces and re-evaluating
+        # annotations pydantic has already processed
+        if not any(_has_forward_ref(a) for a in cls.__annotations__.values()):
+            return
+
         localns = cls._get_local_namespace()
         globalns = cls._get_global_namespace()
 
@@ -27,16 +57,7 @@ class ResolveForwardRefs:
 
     @classmethod
     def _get_global_namespace(cls) -> Dict[str, Any]:
-        globalns = {**builtins.__dict__}
-        import typing
-
-        globalns.update(typing.__dict__)
-        try:
-            import typing_extensions
-
-            globalns.update(typing_extensions.__dict__)
-        except ImportError:
-            pass
+        globalns = {**_base_global_namespace()}
         globalns.update(cls.__registry__)  # type: ignore
         module = sys.modules.get(cls.__module__)
         if module:
@@ -97,15 +118,9 @@ class ResolveForwardRefs:
         if annotation in globalns:
             return globalns[annotation]
 
-        for key, model_class in cls.__registry__.items():  # type: ignore[no-def]
-            if key.endswith(f".{annotation}") or model_class.__name__ == annotation:
-                return model_class
-
-        try:
-            return get_type_hints(annotation, globalns, localns)
-        except Exception:
-            pass
-        return None
+        # The registry is keyed by class name; get_type_hints cannot resolve a
+        # bare string, so there is nothing left to try after this
+        return cls.__registry__.get(annotation)  # type: ignore[no-def]
 
     @classmethod
     def _resolve_generic_forward_ref(
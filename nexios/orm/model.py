@@ -10,6 +10,7 @@ from typing import (
     Dict,
     Any,
     ClassVar,
+    FrozenSet,
     ForwardRef,
     get_origin,
     get_args,
@@ -31,6 +32,24 @@ from nexios.orm.utils import (
     IS_PYDANTIC_V2,
 )
 
+# pydantic >= 2.11 memoizes a setter per attribute name in
+# __pydantic_setattr_handlers__; relationship setters can be registered
+# there instead of overriding __setattr__ for every field write
+_MEMOIZED_SETATTR = hasattr(PydanticBaseModel, "_setattr_handler")
+
+
+def _init_with_relationships(self: "NexiosModel", /, **data: Any) -> None:
+    related_names = data.keys() & self.__relationship_names__
+    if related_names:
+        # Relationships are not pydantic fields; assign them through their
+        # descriptors once the columns are validated
+        related = {name: data.pop(name) for name in related_names}
+        self.__pydantic_validator__.validate_python(data, self_instance=self)
+        for name, value in related.items():
+            setattr(self, name, value)
+    else:
+        self.__pydantic_validator__.validate_python(data, self_instance=self)
+
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(Field, FieldInfo))
 class NexiosModelMetaclass(ModelMetaclass):
@@ -39,6 +58,13 @@ class NexiosModelMetaclass(ModelMetaclass):
     model_fields: Dict[str, FieldInfo] = {}
     __config__: Type[NexiosModelConfig]
     __registry__: Dict[str, Type["NexiosModel"]] = {}
+    # Lowercased class-name and table-name views of the registry, so
+    # foreign-key targets resolve without scanning every model
+    __registry_by_name__: Dict[str, Type["NexiosModel"]] = {}
+    __registry_by_table__: Dict[str, Type["NexiosModel"]] = {}
+    # (model, relationship name) pairs whose back_populates target is not
+    # registered yet
+    __pending_back_populates__: List[Tuple[Type["NexiosModel"], str]] = []
 
     def __new__(
         mcs,
@@ -48,6 +74,8 @@ class NexiosModelMetaclass(ModelMetaclass):
         **kwargs: Any,
     ):
         namespace["__relationships__"] = {}
+        # Per-class store for generated SQL, filled lazily per dialect
+        namespace["__sql_cache__"] = {}
 
         relationships: Dict[str, RelationshipInfo] = {}
         relationship_items = {}
@@ -62,8 +90,12 @@ class NexiosModelMetaclass(ModelMetaclass):
                 relationship_annotations[k] = original_annotations.get(k)
             else:
                 pydantic_dict[k] = v
-                if k in original_annotations:
-                    pydantic_annotations[k] = original_annotations.get(k)
+
+        # Bare annotations (``content: str``) have no namespace entry but
+        # are still columns, so split the annotations on their own
+        for k, annotation in original_annotations.items():
+            if k not in relationship_items:
+                pydantic_annotations[k] = annotation
         dict_used = {
             **pydantic_dict,
             "__annotations__": pydantic_annotations,
@@ -71,17 +103,17 @@ class NexiosModelMetaclass(ModelMetaclass):
         allowed_config_keys = {"read_from_attributes", "from_attributes", "table"}
 
         config_kwargs = {
-            key: kwargs[key] for key in kwargs.keys() & allowed_config_keys
+            key: kwargs.pop(key) for key in kwargs.keys() & allowed_config_keys
         }
-        for k in list(kwargs.keys()):
-            if k in allowed_config_keys:
-                config_kwargs[k] = kwargs.pop(k)
 
         # Create the class
         cls = super().__new__(mcs, name, bases, dict_used, **config_kwargs)
 
         # Register the class
         mcs.__registry__[cls.__name__] = cls
+        mcs.__registry_by_name__[cls.__name__.lower()] = cls
+        if cls.__tablename__:
+            mcs.__registry_by_table__[cls.__tablename__.lower()] = cls
 
         # Process relationships
         for attr_name, rel_info in relationship_items.items():
@@ -90,10 +122,44 @@ class NexiosModelMetaclass(ModelMetaclass):
             )
 
         cls.__relationships__ = relationships
+        mcs.__pending_back_populates__.extend(
+            (cls, attr_name)
+            for attr_name, rel_info in relationships.items()
+            if rel_info.back_populates
+        )
+        mcs._link_back_populates()
+        cls.__relationship_names__ = frozenset(relationships)
+        if relationships and "__init__" not in namespace:
+            # Only models with relationships pay for the kwargs split
+            cls.__init__ = _init_with_relationships
+
+        if _MEMOIZED_SETATTR:
+            handlers = cls.__pydantic_setattr_handlers__
+            for attr_name in relationships:
+                descriptor = cls.__dict__.get(attr_name)
+                if isinstance(descriptor, RelationshipDescriptor):
+                    handlers[attr_name] = descriptor._pydantic_setattr
 
         # Add ColumnDescriptor
         mcs._add_column_descriptors(cls)
 
+        # Immutable snapshot of column names for hot iteration paths
+        cls.__field_names__ = tuple(cls.model_fields)
+
+        # Primary-key metadata is static per class; resolve it once here
+        cls.__pk_field__ = mcs._find_primary_key_field(cls)
+        pk_info = cls.model_fields.get(cls.__pk_field__) if cls.__pk_field__ else None
+        declared_pk = cls.__primary_key__
+        is_composite = isinstance(declared_pk, (list, tuple)) and len(declared_pk) > 1
+        cls.__pk_auto_increment__ = not is_composite and bool(
+            getattr(pk_info, "auto_increment", False)
+        )
+        cls.__auto_increment_fields__ = frozenset(
+            name
+            for name, info in cls.model_fields.items()
+            if getattr(info, "auto_increment", False)
+        )
+
         cls.__annotations__ = {
             **relationship_annotations,
             **pydantic_annotations,
@@ -103,6 +169,27 @@ class NexiosModelMetaclass(ModelMetaclass):
         cls.resolve_forward_references()
         return cls
 
+    @classmethod
+    def _link_back_populates(mcs):
+        """Point each relationship descriptor at its back_populates peer once
+        the related model exists; unresolved pairs wait for later classes."""
+        pending = []
+        for model, attr_name in mcs.__pending_back_populates__:
+            rel_info = model.__relationships__[attr_name]
+            related_model = rel_info.related_model
+            if related_model is None:
+                pending.append((model, attr_name))
+                continue
+
+            descriptor = model.__dict__.get(attr_name)
+            back_descriptor = related_model.__dict__.get(rel_info.back_populates)
+            if isinstance(descriptor, RelationshipDescriptor) and isinstance(
+                back_descriptor, RelationshipDescriptor
+            ):
+                descriptor._back_descriptor = back_descriptor
+            rel_info.is_resolved = True
+        mcs.__pending_back_populates__[:] = pending
+
     @classmethod
     def _add_column_descriptors(mcs, cls: Type["NexiosModel"]):
         """Replace model fields with ColumnDescriptors"""
@@ -119,6 +206,29 @@ class NexiosModelMetaclass(ModelMetaclass):
             descriptor = ColumnDescriptor(field_name, cls)
             setattr(cls, field_name, descriptor)
 
+    @classmethod
+    def _find_primary_key_field(mcs, cls: Type["NexiosModel"]) -> Optional[str]:
+        # An explicit __primary_key__ wins; composite keys report their first column
+        declared_pk = cls.__primary_key__
+        if isinstance(declared_pk, str) and declared_pk:
+            return declared_pk
+        if isinstance(declared_pk, (list, tuple)) and declared_pk:
+            return declared_pk[0]
+
+        fields = get_model_fields(cls)
+        for field_name, field_info in fields.items():
+            primary_key = getattr(field_info, "primary_key", Undefined)
+            if primary_key is not Undefined and primary_key:
+                return field_name
+
+        # No field is explicitly marked; PydanticUndefined is truthy, so this
+        # keeps the historic behaviour of treating the first unmarked field
+        # as the primary key
+        for field_name, field_info in fields.items():
+            if getattr(field_info, "primary_key", Undefined):
+                return field_name
+        return None
+
     @classmethod
     def _process_relationship(
         mcs,
@@ -240,8 +350,8 @@ class NexiosModelMetaclass(ModelMetaclass):
         origin = get_origin(annotation)
         args = get_args(annotation)
 
-        # Optional[T]
-        if origin is Union:
+        # Optional[T] / T | None
+        if origin is Union or origin is types.UnionType:
             result["is_optional"] = True
             for arg in args:
                 if arg is type(None):
@@ -251,8 +361,8 @@ class NexiosModelMetaclass(ModelMetaclass):
                 result["is_optional"] = True
                 return result
 
-        # List[T]
-        if origin in (list, List):
+        # List[T] (get_origin(List[T]) is list)
+        if origin is list:
             result["is_list"] = True
             if args:
                 arg = args[0]
@@ -347,7 +457,7 @@ class NexiosModelMetaclass(ModelMetaclass):
                     tablename_from_registry = ""
                     if model_cls_from_registry:
                         tablename_from_registry = (
-                            get_tablename_for_class(model_cls_from_registry) or ""
+                            model_cls_from_registry.__tablename__ or ""
                         )
 
                     candidates = {
@@ -431,10 +541,17 @@ class NexiosModel(
 ):
     __tablename__: ClassVar[Optional[str]] = None
     __relationships__: ClassVar[Dict[str, RelationshipInfo]] = {}
+    __sql_cache__: ClassVar[Dict[Any, Any]] = {}
+    __field_names__: ClassVar[Tuple[str, ...]] = ()
+    __pk_field__: ClassVar[Optional[str]] = None
+    __pk_auto_increment__: ClassVar[bool] = False
+    __auto_increment_fields__: ClassVar[FrozenSet[str]] = frozenset()
+    __relationship_names__: ClassVar[FrozenSet[str]] = frozenset()
     __primary_key__: ClassVar[Union[Tuple[str, ...], List[str], str, None]] = None
 
     if IS_PYDANTIC_V2:
-        model_config = NexiosModelConfig(from_attributes=True)
+        # Core validators/serializers are compiled on first use, not at import
+        model_config = NexiosModelConfig(from_attributes=True, defer_build=True)
     else:
 
         class Config:
@@ -443,62 +560,44 @@ class NexiosModel(
     def __init_subclass__(cls, table: Optional[bool] = None, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        cls.__registry__[cls.__name__] = cls
-
+        # Registration happens once in NexiosModelMetaclass.__new__
         if table is not None:
             set_config_value(model=cls, parameter="table", value=table)
 
-        tablename = get_tablename_for_class(cls)
-        cls.__tablename__ = tablename
+        cls.__tablename__ = get_tablename_for_class(cls)
 
-    def model_post_init(self, __context: Any) -> None:
-        """Pydantic v2 hook for post-initialization."""
-        self.__dict__["__relationship_cache__"] = {} # type: ignore
+    if not _MEMOIZED_SETATTR:
 
-    def __setattr__(self, name: str, value: Any) -> types.NoneType:
-        if name not in self.__relationships__:
+        def __setattr__(self, name: str, value: Any) -> types.NoneType:
+            if name in self.__relationship_names__:
+                # pydantic rejects non-field names, so hand relationship
+                # assignment to its descriptor (cache + foreign-key sync)
+                type(self).__dict__[name].__set__(self, value)
+                return
             super().__setattr__(name, value)
 
-    @classmethod
-    def _resolve_relationships(cls):
-        for rel_name, rel_info in cls.__relationships__.items():
-            if not rel_info.is_resolved:
-                if rel_info.back_populates:
-                    related_model = rel_info.related_model
-                    if related_model and hasattr(related_model, "__relationships__"):
-                        related_rel = related_model.__relationships__.get(
-                            rel_info.back_populates
-                        )
-
-                        if related_rel:
-                            related_rel.back_populates = rel_name
-                            related_rel.is_resolved = True
-                            rel_info.is_resolved = True
-                rel_info.is_resolved = True
-
     @classmethod
     def get_fields(cls) -> Dict[str, FieldInfo]:
         return cls.model_fields
 
+    @classmethod
+    def get_field_names(cls) -> Tuple[str, ...]:
+        return cls.__field_names__
+
+    def get_field_values(self) -> Dict[str, Any]:
+        values = self.__dict__
+        return {name: values.get(name) for name in self.__field_names__}
+
     @classmethod
     def get_relationships(cls) -> Dict[str, RelationshipInfo]:
         return cls.__relationships__
 
     @classmethod
     def get_primary_key(cls) -> Any:
-        from nexios.orm.query.expressions import ColumnExpression
-
-        pk = getattr(cls, "__primary_key__", None)
+        pk = cls.__primary_key__
         if pk:
             if isinstance(pk, (tuple, list)):
                 return tuple(pk) if len(pk) > 1 else pk[0]  # type: ignore
             return pk
 
-        for field_name, field_info in get_model_fields(cls).items():
-            if getattr(field_info, "primary_key", Undefined):
-                field_ = getattr(cls, field_name)
-                if isinstance(field_, ColumnExpression):
-                    return field_.field_name
-                else:
-                    return field_
-        return None
+        return cls.__pk_field__
@@ -31,6 +31,9 @@ class AsyncConnectionPool(BaseAsyncConnectionPool):
 
         self._lock = asyncio.Lock()
         self._condition = asyncio.Condition(self._lock)
+        # Tasks blocked in _condition.wait(); the lock-free checkout path
+        # stays out of the way while any are queued
+        self._waiting = 0
 
         self._connection_times: Dict[AsyncDatabaseConnection, float] = {}
         self._connection_usage: Dict[AsyncDatabaseConnection, int] = {}
@@ -54,10 +57,14 @@ class AsyncConnectionPool(BaseAsyncConnectionPool):
     async def initialize(self):
         if self._initialized:
             return
-        
-        await self._initialize_pool()
-        self._start_background_tasks()
-        self._initialized = True
+
+        # Tasks racing for their first connection must not each fill the pool
+        async with self._lock:
+            if self._initialized:
+                return
+            await self._initialize_pool()
+            self._start_background_tasks()
+            self._initialized = True
 
         self.logger.info("AsyncConnectionPool initialized with config: %s", self.config)
 
@@ -176,6 +183,18 @@ class AsyncConnectionPool(BaseAsyncConnectionPool):
         self._stats['acquire_requests'] += 1
         start_time = time.monotonic()
 
+        # Fast path: an idle connection and nobody queued or holding the
+        # lock. Nothing below awaits real I/O before the connection is
+        # marked in use, so no other task can interleave.
+        while self._available and not self._waiting and not self._lock.locked():
+            conn, last_used = self._available.pop()
+            if await self._quick_validate(conn, last_used):
+                self._in_use[conn] = start_time
+                self._connection_usage[conn] = self._connection_usage.get(conn, 0) + 1
+                return conn
+            await self._safe_close_connection(conn)
+            self._stats['connections_closed'] += 1
+
         async with self._condition:
             while self._available:
                 conn, last_used = self._available.pop()
@@ -203,30 +222,34 @@ class AsyncConnectionPool(BaseAsyncConnectionPool):
                     self.logger.error("Failed to create new connection: %s", e)
                     raise
             
-            timeout = self.config.connection_timeout - (time.monotonic() - start_time)
-            if timeout <= 0:
-                self._stats['acquire_timeouts'] += 1
-                raise asyncio.TimeoutError("Timed out waiting for a connection from the pool.")
-            
-            try:
-                await asyncio.wait_for(self._condition.wait(), timeout)
-            except asyncio.TimeoutError:
-                self._stats['acquire_timeouts'] += 1
-                raise asyncio.TimeoutError(f"Timed out waiting for a connection from the pool after: {timeout:.1f}s")
-            
-            while self._available:
-                conn, last_used = self._available.pop()
-                if await self._quick_validate(conn, last_used):
-                    self._in_use[conn] = time.monotonic()
-                    self._connection_usage[conn] = self._connection_usage.get(conn, 0) + 1
-                    return conn
-                else:
-                    await self._safe_close_connection(conn)
-                    self._stats['connections_closed'] += 1
-            
-            self._stats['acquire_timeouts'] += 1
-            raise asyncio.TimeoutError("Timed out waiting for a connection from the pool.")
-    
+            # A woken waiter can find the idle list empty again if another
+            # task got there first, so keep waiting until the deadline
+            deadline = start_time + self.config.connection_timeout
+            while True:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    self._stats['acquire_timeouts'] += 1
+                    raise asyncio.TimeoutError("Timed out waiting for a connection from the pool.")
+
+                self._waiting += 1
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    self._stats['acquire_timeouts'] += 1
+                    raise asyncio.TimeoutError(f"Timed out waiting for a connection from the pool after: {self.config.connection_timeout:.1f}s")
+                finally:
+                    self._waiting -= 1
+
+                while self._available:
+                    conn, last_used = self._available.pop()
+                    if await self._quick_validate(conn, last_used):
+                        self._in_use[conn] = time.monotonic()
+                        self._connection_usage[conn] = self._connection_usage.get(conn, 0) + 1
+                        return conn
+                    else:
+                        await self._safe_close_connection(conn)
+                        self._stats['connections_closed'] += 1
+
     async def _quick_validate(self, conn: AsyncDatabaseConnection, last_used: Optional[float] = None) -> bool:
         """Connetion validation"""
         try:
@@ -248,21 +271,26 @@ class AsyncConnectionPool(BaseAsyncConnectionPool):
         
         return_time = time.monotonic()
 
+        if conn not in self._in_use:
+            await self._safe_close_connection(conn)
+            return
+        del self._in_use[conn]
+
+        # The connection is still private to this task, so the rollback's
+        # round trip does not need to hold up other checkouts
+        if not await self._quick_validate(conn):
+            await self._safe_close_connection(conn)
+            self._stats['connections_closed'] += 1
+            await self._trigger_event(PoolEvent.CONNECTION_INVALID, conn)
+            return
+        await self._reset_connection(conn)
+
         async with self._condition:
-            if conn in self._in_use:
-                del self._in_use[conn]
-            else:
+            if self._closed:
                 await self._safe_close_connection(conn)
                 return
-            
-            if await self._quick_validate(conn):
-                await self._reset_connection(conn)
-                self._available.append((conn, return_time))
-                self._condition.notify()
-            else:
-                await self._safe_close_connection(conn)
-                self._stats['connections_closed'] += 1
-                await self._trigger_event(PoolEvent.CONNECTION_INVALID, conn)
+            self._available.append((conn, return_time))
+            self._condition.notify()
     
     async def _reset_connection(self, conn: AsyncDatabaseConnection) -> None:
         """Reset connection state before returning to pool."""
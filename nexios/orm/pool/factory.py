@@ -1,3 +1,4 @@
+from dataclasses import fields
 from typing import Callable, Awaitable
 
 from nexios.orm.connection import SyncDatabaseConnection, AsyncDatabaseConnection
@@ -9,20 +10,20 @@ from nexios.orm.pool.base import (
 )
 from nexios.orm.pool.connection_pool import ConnectionPool
 
+# Tunables accepted from **kwargs; anything else is ignored as before
+_POOL_CONFIG_FIELDS = frozenset(f.name for f in fields(PoolConfig))
+
 
 class ConnectionPoolFactory:
     @staticmethod
     def config(min_size, max_size, **kwargs) -> PoolConfig:
-        return PoolConfig(
-            max_size=max_size,
-            min_size=min_size,
-            connection_timeout=kwargs.get("connection_timeout", 5.0),
-            max_lifetime=kwargs.get("max_lifetime", 7200),
-            idle_timeout=kwargs.get("idle_timeout", 300),
-            health_check_interval=kwargs.get("health_check_interval", 60),
-            shrink_interval=kwargs.get("shrink_interval", 30),
-            max_idle=kwargs.get("max_idle", 10),
-        )
+        # Defaults live on PoolConfig; only forward what the caller set
+        overrides = {
+            key: value for key, value in kwargs.items() if key in _POOL_CONFIG_FIELDS
+        }
+        overrides["max_size"] = max_size
+        overrides["min_size"] = min_size
+        return PoolConfig(**overrides)
     
     @staticmethod
     def create_sync_pool(
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import operator
 import re
 
 from collections import defaultdict
-from typing import TypeAlias, cast, Callable, Any
+from typing import TypeAlias, cast, Callable, Any, AsyncIterator, Iterator
 
 from typing_extensions import (
     Type,
@@ -16,17 +17,20 @@ from typing_extensions import (
     Literal,
     Self,
     Dict,
+    Set,
     overload,
     TYPE_CHECKING,
 )
 from pydantic_core import PydanticUndefined as Undefined
-from nexios.orm.query.expressions import ColumnExpression, BinaryExpression, AlwaysTrueExpression, AlwaysFalseExpression
+from nexios.orm.query.expressions import ColumnExpression, BinaryExpression, CompoundExpression, AlwaysTrueExpression, AlwaysFalseExpression, BindParam, resolve_bind_params
 from nexios.orm.sessions import Session, AsyncSession
 from nexios.orm.relationships import RelationshipType
+from nexios.orm.descriptors import RelationshipDescriptor
+from nexios.orm.config import get_param_placeholder
+from nexios.orm.model import NexiosModel
 
 if TYPE_CHECKING:
     from nexios.orm.config import Dialect
-    from nexios.orm.model import NexiosModel
     from nexios.orm.utils import InstanceOrType
 
 _T = TypeVar("_T", bound="NexiosModel")
@@ -35,9 +39,62 @@ _M = TypeVar("_M", bound="NexiosModel")
 
 _BinaryExpressionTuple: TypeAlias = Tuple[BinaryExpression]
 _UnionBinaryExpression: TypeAlias = Union[BinaryExpression, str, None]
+_BuildMode: TypeAlias = Literal["normal", "count", "exists"]
+_UNRESOLVED: Any = object()
+
+
+def _select_list(
+    model: Type[NexiosModel], dialect: Dialect, alias: Optional[str] = None
+) -> str:
+    """Quoted, comma-separated column list for ``model``, built once per
+    dialect (and alias) and kept in the model's SQL cache."""
+    cache = model.__sql_cache__
+    key = (type(dialect), "select_list", alias)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    quote = dialect.quote_identifier
+    if alias is None:
+        table_name = model.__tablename__
+        assert table_name is not None
+        quoted_table = quote(table_name)
+        columns = [f"{quoted_table}.{quote(name)}" for name in model.__field_names__]
+    else:
+        quoted_alias = quote(alias)
+        columns = [
+            f"{quoted_alias}.{quote(name)} AS {quote(f'{alias}_{name}')}"
+            for name in model.__field_names__
+        ]
+    sql = cache[key] = ", ".join(columns)
+    return sql
 
 
 class Select(Generic[_T]):
+    __slots__ = (
+        "entities",
+        "_where",
+        "_params",
+        "_order_by",
+        "_limit",
+        "_offset",
+        "_session",
+        "_joins",
+        "_distinct",
+        "_group_by",
+        "_having",
+        "_table_aliases",
+        "_used_aliases",
+        "_alias_counter",
+        "_eager_load",
+        "_joined_load",
+        "_compiled",
+        "_paged",
+        "_bind_values",
+        "_primary_model",
+    )
+
     def __init__(self, *entities: Any):
         self.entities = entities
         self._where: List[BinaryExpression] = []
@@ -53,10 +110,23 @@ class Select(Generic[_T]):
         self._group_by: List[Union[ColumnExpression, str]] = []
         self._having: List[BinaryExpression] = []
         self._table_aliases: Dict[Type[NexiosModel], str] = {}
+        self._used_aliases: Set[str] = set()
         self._alias_counter = 0
 
         self._eager_load: Dict[str, List[str]] = {}
         self._joined_load: Dict[str, List[str]] = {}
+        # (dialect type, driver, mode) -> last _build_sql result without
+        # LIMIT/OFFSET and whether its params hold bindparam() placeholders;
+        # cleared by every builder method that changes the statement
+        self._compiled: Optional[
+            Tuple[Tuple[Any, ...], Tuple[str, Tuple[Any, ...], Any, bool], bool]
+        ] = None
+        # (compiled entry, limit, offset, sql): the paged SQL of the current
+        # compilation, so limit()/offset() changes do not recompile it
+        self._paged: Optional[Tuple[Any, Optional[int], Optional[int], str]] = None
+        # Values for bindparam() placeholders; not part of the compiled SQL
+        self._bind_values: Dict[str, Any] = {}
+        self._primary_model: Any = _UNRESOLVED
 
     def _generate_alias(self, model: Type[NexiosModel]) -> str:
         """Generate unique table alias"""
@@ -69,11 +139,12 @@ class Select(Generic[_T]):
 
         # Ensure uniqueness
         counter = 1
-        while alias in self._table_aliases.values():
+        while alias in self._used_aliases:
             alias = f"{base_alias}{counter}"
             counter += 1
 
         self._table_aliases[model] = alias
+        self._used_aliases.add(alias)
         return alias
 
     def _bind(self, session: Any):
@@ -88,85 +159,76 @@ class Select(Generic[_T]):
             elif condition is False:
                 self._where.append(AlwaysFalseExpression()) # type: ignore
             else:
-                self._where.extend(expr)
+                self._where.append(condition)
+        self._compiled = None
         return self
 
     def and_where(self, *conditions: bool) -> Self:
         return self.where(*conditions)
 
+    def params(self, **values: Any) -> Self:
+        """Supply values for ``bindparam()`` placeholders.
+
+        The compiled SQL is kept, so re-executing with new values skips
+        rendering the statement again.
+        """
+        self._bind_values.update(values)
+        return self
+
     def order_by(self, *fields: Union[ColumnExpression[_T], str]) -> Self:
         self._order_by.extend(fields)
+        self._compiled = None
         return self
 
     def limit(self, n: int) -> Self:
-        self._limit = n
+        # Rendered into the SQL text, so only accept real integers
+        self._limit = operator.index(n)
         return self
 
     def offset(self, n: int) -> Self:
-        self._offset = n
+        self._offset = operator.index(n)
         return self
 
     def distinct(self) -> Self:
         """Add DISTINCT clause"""
         self._distinct = True
+        self._compiled = None
         return self
 
     def group_by(self, *fields: Union[ColumnExpression, str]) -> Self:
         """Add GROUP BY clause"""
         self._group_by.extend(fields)
+        self._compiled = None
         return self
 
     def having(self, *conditions: BinaryExpression) -> Self:
         """Add HAVING clause"""
         self._having.extend(conditions)
+        self._compiled = None
         return self
 
     def _transform_count(self, rows: List[Tuple[Any, ...]]) -> int:
         return rows[0][0] if rows else 0
 
     async def _async_count(self) -> int:
-        count_select = self._clone()
-        primary_model = self._get_primary_model()
-        count_select.entities = ("COUNT(*)", primary_model)
-        count_select._order_by = []  # Remove ordering for count
-        count_select._limit = None
-        count_select._offset = None
-
-        rows = await count_select._execute_async()
+        rows, _, _ = await self._execute_async("count")
         return self._transform_count(rows)
 
     def _count(self) -> int:
         """Return count of records matching the query"""
-        count_select = self._clone()
-        primary_model = self._get_primary_model()
-        count_select.entities = ("COUNT(*)", primary_model)
-        count_select._order_by = []  # Remove ordering for count
-        count_select._limit = None
-        count_select._offset = None
-
-        rows = count_select._execute_sync()
+        rows, _, _ = self._execute_sync("count")
         return self._transform_count(rows)
 
     def _transform_exists(self, rows: List[Tuple[Any, ...]]) -> bool:
         return len(rows) > 0
 
     async def _async_exists(self) -> bool:
-        exists_select = self._clone()
-        primary_model = self._get_primary_model()
-        exists_select._limit = 1
-        exists_select.entities = ("1", primary_model)
-
-        rows = await exists_select._execute_async()
+        rows, _, _ = await self._execute_async("exists")
         return self._transform_exists(rows)
 
     def _exists(self) -> bool:
         """Check if any records match the query"""
-        exists_select = self._clone()
-        primary_model = self._get_primary_model()
-        exists_select._limit = 1
-        exists_select.entities = ("1", primary_model)
-
-        rows = exists_select._execute_sync()
+        rows, _, _ = self._execute_sync("exists")
         return self._transform_exists(rows)
 
     def join(
@@ -178,9 +240,14 @@ class Select(Generic[_T]):
     ) -> Self:
         """Add JOIN clause on the query"""
         expression = cast(_UnionBinaryExpression, on_condition)
+        if alias:
+            # Explicit aliases must also block generated ones
+            self._table_aliases[right_model] = alias
+            self._used_aliases.add(alias)
         join_alias = alias or self._generate_alias(right_model)
 
         self._joins.append((join_type, right_model, join_alias, expression))  # type: ignore
+        self._compiled = None
         return self
 
     def left_join(
@@ -212,7 +279,6 @@ class Select(Generic[_T]):
     def eager_load(self, *relationships: str) -> Self:
         """Add eager loading to the query"""
         for rel_path in relationships:
-            print(f"Relationship path: {rel_path}")
             parts = rel_path.split(".") or rel_path.split("_")
             if len(parts) == 1:
                 self._eager_load.setdefault("*", []).append(rel_path)
@@ -238,6 +304,18 @@ class Select(Generic[_T]):
         self, left_model: Type[NexiosModel], right_model: Type[NexiosModel]
     ) -> BinaryExpression:
         """Try to infer condition based on field names"""
+        # Fields and relationships are fixed per class, so each model pair
+        # is scanned once
+        cache = left_model.__sql_cache__
+        key = ("join_condition", right_model)
+        condition = cache.get(key)
+        if condition is None:
+            condition = cache[key] = self._scan_join_condition(left_model, right_model)
+        return condition
+
+    def _scan_join_condition(
+        self, left_model: Type[NexiosModel], right_model: Type[NexiosModel]
+    ) -> BinaryExpression:
         left_fields = left_model.get_fields()
         right_fields = right_model.get_fields()
 
@@ -327,8 +405,13 @@ class Select(Generic[_T]):
         )
 
     def _get_primary_model(self) -> Optional[Type["NexiosModel"]]:
-        from nexios.orm.model import NexiosModel
+        # entities are fixed at construction, so resolve them once
+        primary_model = self._primary_model
+        if primary_model is _UNRESOLVED:
+            primary_model = self._primary_model = self._find_primary_model()
+        return primary_model
 
+    def _find_primary_model(self) -> Optional[Type["NexiosModel"]]:
         for entity in self.entities:
             if isinstance(entity, type) and issubclass(entity, NexiosModel):
                 return entity
@@ -336,53 +419,107 @@ class Select(Generic[_T]):
                 return entity.model_cls
         return None
 
-    def _build_sql(self, dialect: Dialect, driver):
-        from nexios.orm.model import NexiosModel
-        from nexios.orm.config import get_param_placeholder
-
-        param_placeholder = get_param_placeholder(driver)
-        params: List[Any] = []
-        primary_model = self._get_primary_model()
-
-        if not primary_model:
-            raise ValueError("Could not determine primary model from selected entities")
+    def _build_sql(self, dialect: Dialect, driver, mode: _BuildMode = "normal"):
+        """Return ``(sql, params, primary_model, map_to_model)``, reusing the
+        last compilation while the statement is unchanged.
+
+        ``mode`` "count" renders ``SELECT COUNT(*)`` without ordering or
+        paging; "exists" renders ``SELECT 1 ... LIMIT 1`` without ordering.
+        """
+        compiled = self._compiled_entry(dialect, driver, mode)
+        _, params, model, map_to_model = compiled[1]
+        return self._paged_sql(compiled, dialect, mode), params, model, map_to_model
+
+    def _compiled_entry(self, dialect: Dialect, driver, mode: _BuildMode):
+        key = (type(dialect), driver, mode)
+        compiled = self._compiled
+        if compiled is None or compiled[0] != key:
+            built = self._compile_sql(dialect, driver, mode)
+            has_binds = any(isinstance(p, BindParam) for p in built[1])
+            compiled = self._compiled = (key, built, has_binds)
+        return compiled
+
+    def _paged_sql(self, compiled: Any, dialect: Dialect, mode: _BuildMode) -> str:
+        """Compiled SQL with the current LIMIT/OFFSET appended"""
+        if mode == "count":
+            return compiled[1][0]
+        limit = 1 if mode == "exists" else self._limit
+        offset = self._offset
+
+        paged = self._paged
+        if (
+            paged is not None
+            and paged[0] is compiled
+            and paged[1] == limit
+            and paged[2] == offset
+        ):
+            return paged[3]
+
+        sql = compiled[1][0]
+        limit_sql = dialect.get_limit_offset_sql(limit, offset)
+        if limit_sql:
+            sql = f"{sql} {limit_sql}"
+        self._paged = (compiled, limit, offset, sql)
+        return sql
+
+    def _statement(self, mode: _BuildMode):
+        """Compiled ``(sql, params, model, map_to_model)`` for the bound
+        session, with bindparam() values substituted"""
+        engine = self._session.engine
+        compiled = self._compiled_entry(engine.dialect, engine.driver, mode)
+        _, (_, params, model, map_to_model), has_binds = compiled
+        sql = self._paged_sql(compiled, engine.dialect, mode)
+        if has_binds:
+            params = resolve_bind_params(params, self._bind_values)
+        return sql, params, model, map_to_model
+
+    def _compile_head(
+        self, primary_model: Type[NexiosModel], dialect: Dialect, mode: _BuildMode
+    ) -> Tuple[str, bool]:
+        """``SELECT ... FROM ...`` and whether rows map to ``primary_model``.
+
+        The head depends only on the entities, DISTINCT and table aliases,
+        so for unaliased model/string entities it is shared by every Select
+        of the same shape through the primary model's SQL cache.
+        """
+        cache_key = None
+        if not self._table_aliases and all(
+            isinstance(e, (type, str)) for e in self.entities
+        ):
+            cache_key = (
+                "head", type(dialect), tuple(self.entities), self._distinct, mode
+            )
+            cached = primary_model.__sql_cache__.get(cache_key)
+            if cached is not None:
+                return cached
 
         select_parts = []
         map_to_model = False
 
-        has_count = any(
+        has_count = mode == "count" or any(
             isinstance(entity, str) and entity.startswith("COUNT")
             for entity in self.entities
         )
-        has_exists = any(
+        has_exists = mode == "exists" or any(
             isinstance(entity, str) and entity.startswith("1")
             for entity in self.entities
         )
 
-        for entity in self.entities:
+        if mode == "count":
+            select_parts.append("COUNT(*)")
+        elif mode == "exists":
+            select_parts.append("1")
+
+        for entity in self.entities if mode == "normal" else ():
             if isinstance(entity, type) and issubclass(entity, NexiosModel):
                 if has_count or has_exists:
                     continue
 
                 if entity == primary_model:
-                    table_name = entity.__tablename__
-                    assert table_name is not None
-                    quoted_table = dialect.quote_identifier(table_name)
-
-                    for field_name in entity.get_fields().keys():
-                        quoted_field = dialect.quote_identifier(field_name)
-                        select_parts.append(f"{quoted_table}.{quoted_field}")
-                    # map_to_model = True
+                    select_parts.append(_select_list(entity, dialect))
                 else:
                     alias = self._table_aliases.get(entity, entity.__tablename__)
-                    quoted_alias = dialect.quote_identifier(alias)  # type: ignore
-
-                    for field_name in entity.get_fields().keys():
-                        quoted_field = dialect.quote_identifier(field_name)
-                        select_alias = dialect.quote_identifier(f"{alias}_{field_name}")
-                        select_parts.append(
-                            f"{quoted_alias}.{quoted_field} AS {select_alias}"
-                        )
+                    select_parts.append(_select_list(entity, dialect, alias))
             elif isinstance(entity, ColumnExpression):
                 # select_parts.append(str(entity))
                 table_name = entity.model_cls.__tablename__
@@ -401,8 +538,7 @@ class Select(Generic[_T]):
             map_to_model = True
 
         # Build SELECT clause with distinct
-        distinct_clause = "DISTINCT " if self._distinct else ""
-        select_clause = f"SELECT {distinct_clause}{', '.join(select_parts)}"
+        select_clause = ("SELECT DISTINCT " if self._distinct else "SELECT ") + ", ".join(select_parts)
 
         primary_table = primary_model.__tablename__
         primary_alias = self._table_aliases.get(primary_model, primary_table)
@@ -412,7 +548,21 @@ class Select(Generic[_T]):
         if primary_alias != primary_table:
             from_clause += f" AS {dialect.quote_identifier(primary_alias)}"
 
-        sql_parts = [select_clause, from_clause]
+        head = (select_clause + " " + from_clause, map_to_model)
+        if cache_key is not None:
+            primary_model.__sql_cache__[cache_key] = head
+        return head
+
+    def _compile_sql(self, dialect: Dialect, driver, mode: _BuildMode = "normal"):
+        param_placeholder = get_param_placeholder(driver)
+        params: List[Any] = []
+        primary_model = self._get_primary_model()
+
+        if not primary_model:
+            raise ValueError("Could not determine primary model from selected entities")
+
+        head, map_to_model = self._compile_head(primary_model, dialect, mode)
+        sql_parts = [head]
 
         # JOIN clauses
         for join_type, right_model, alias, condition in self._joins:
@@ -423,39 +573,10 @@ class Select(Generic[_T]):
             if condition is None:
                 condition = self._infer_join_condition(primary_model, right_model)
 
-            if isinstance(condition, BinaryExpression):
-                left_col = condition.column
-                right_val = condition.value
-
-                left_table_alias = self._table_aliases.get(
-                    left_col.model_cls, left_col.model_cls.__tablename__
-                )
-
-                quoted_left = (
-                    dialect.quote_identifier(left_table_alias) # type: ignore
-                    + "."
-                    + dialect.quote_identifier(  # type: ignore
-                        left_col.field_name
-                    )
+            if isinstance(condition, (BinaryExpression, CompoundExpression)):
+                on_sql, on_params = condition.to_sql(
+                    param_placeholder, dialect, driver, self._table_aliases
                 )
-
-                if isinstance(right_val, ColumnExpression):
-                    right_table_alias = self._table_aliases.get(
-                        right_val.model_cls, right_val.model_cls.__tablename__
-                    )
-                    quoted_right = (
-                        dialect.quote_identifier(right_table_alias) # type: ignore
-                        + "."
-                        + dialect.quote_identifier(  # type: ignore
-                            right_val.field_name
-                        )
-                    )
-                    on_sql = f"{quoted_left} {condition.operator} {quoted_right}"
-                    on_params = []
-                else:
-                    on_sql = f"{quoted_left} {condition.operator} {param_placeholder}"
-                    on_params = [right_val] if right_val is not None else []
-                # on_sql, on_params = condition.to_sql(param_placeholder, dialect)
                 params.extend(on_params)
             elif isinstance(condition, str):
                 on_sql = condition
@@ -470,44 +591,21 @@ class Select(Generic[_T]):
         # WHERE
         if self._where:
             where_parts = []
+            # Joined queries need table-qualified columns
+            table_aliases = self._table_aliases if self._joins else None
             for cond in self._where:
-                if self._joins:
-                    left_col = cond.column
-                    left_table_alias = self._table_aliases.get(
-                        left_col.model_cls, left_col.model_cls.__tablename__
+                if table_aliases is not None and isinstance(
+                    cond, (BinaryExpression, CompoundExpression)
+                ):
+                    sql_part, p = cond.to_sql(
+                        param_placeholder, dialect, driver, table_aliases
                     )
-                    quoted_left = (
-                        dialect.quote_identifier(left_table_alias) # type: ignore
-                        + "."
-                        + dialect.quote_identifier(  # type: ignore
-                            left_col.field_name
-                        )
-                    )
-                    if isinstance(cond.value, ColumnExpression):
-                        right_col = cond.value
-                        right_table_alias = self._table_aliases.get(
-                            right_col.model_cls, right_col.model_cls.__tablename__
-                        )
-                        quoted_right = (
-                            dialect.quote_identifier(right_table_alias) # type: ignore
-                            + "."
-                            + dialect.quote_identifier(  # type: ignore
-                                right_col.field_name
-                            )
-                        )
-                        sql_part = f"{quoted_left} {cond.operator} {quoted_right}"
-                        p = []
-                    else:
-                        # Value comparison
-                        sql_part = f"{quoted_left} {cond.operator} {param_placeholder}"
-                        p = [cond.value] if cond.value is not None else []
                 else:
                     sql_part, p = cond.to_sql(param_placeholder, dialect, driver)
 
                 where_parts.append(sql_part)
                 params.extend(p)
-            where_clause = " AND ".join(where_parts)
-            sql_parts.append(f"WHERE {where_clause}")
+            sql_parts.append("WHERE " + " AND ".join(where_parts))
 
         # GROUP BY clause
         if self._group_by:
@@ -520,8 +618,7 @@ class Select(Generic[_T]):
                     group_parts.append(field.to_sql(dialect, table_alias))
                 else:
                     group_parts.append(field)
-            group_clause = "GROUP BY " + ", ".join(group_parts)
-            sql_parts.append(group_clause)
+            sql_parts.append("GROUP BY " + ", ".join(group_parts))
 
         # HAVING clause
         if self._having:
@@ -530,11 +627,10 @@ class Select(Generic[_T]):
                 cond_sql, cond_params = condition.to_sql(param_placeholder, dialect)
                 params.extend(cond_params)
                 having_parts.append(cond_sql)
-            having_clause = "HAVING " + " AND ".join(having_parts)
-            sql_parts.append(having_clause)
+            sql_parts.append("HAVING " + " AND ".join(having_parts))
 
         # ORDER BY
-        if self._order_by:
+        if self._order_by and mode == "normal":
             order_parts = []
             for field in self._order_by:
                 if isinstance(field, ColumnExpression):
@@ -549,50 +645,66 @@ class Select(Generic[_T]):
                 else:
                     order_parts.append(field)
 
-            order_clause = "ORDER BY " + ", ".join(order_parts)
-            sql_parts.append(order_clause)
-
-        # LIMIT and OFFSET
-        limit_sql = dialect.get_limit_offset_sql(self._limit, self._offset)
-        if limit_sql:
-            sql_parts.append(limit_sql)
+            sql_parts.append("ORDER BY " + ", ".join(order_parts))
 
+        # LIMIT and OFFSET are appended per execution by _paged_sql
         sql = " ".join(sql_parts)
 
-        return sql, params, primary_model, map_to_model
+        return sql, tuple(params), primary_model, map_to_model
 
-    def _execute_sync(self) -> List[Tuple[Any, ...]]:
-        """Execute query synchronously"""
+    def _execute_sync(
+        self, mode: _BuildMode = "normal"
+    ) -> Tuple[List[Tuple[Any, ...]], Type[NexiosModel], bool]:
+        """Execute query synchronously, returning ``(rows, model, map_to_model)``"""
         if not self._session or not isinstance(self._session, Session):
             raise ValueError("No sync session bound to this query")
 
-        sql, params, model, map_to_model = self._build_sql(
-            self._session.engine.dialect, self._session.engine.driver
-        )
-        return self._session.execute(sql, tuple(params)).fetchall()
+        sql, params, model, map_to_model = self._statement(mode)
+        return self._session.execute(sql, params).fetchall(), model, map_to_model
 
-    async def _execute_async(self) -> List[Tuple[Any, ...]]:
-        """Execute query asynchronously"""
+    async def _execute_async(
+        self, mode: _BuildMode = "normal"
+    ) -> Tuple[List[Tuple[Any, ...]], Type[NexiosModel], bool]:
+        """Execute query asynchronously, returning ``(rows, model, map_to_model)``"""
         if not self._session or not isinstance(self._session, AsyncSession):
             raise ValueError("No async session bound to this query")
 
-        sql, params, model, map_to_model = self._build_sql(
-            self._session.engine.dialect, self._session.engine.driver
-        )
-        return await (await self._session.execute(sql, tuple(params))).fetchall()
-
-    def _execute_with_eager_loading(self, rows_func: Callable):
-        """Execute query with eager loading support"""
-        # First, get the main results
-        results = rows_func()
+        sql, params, model, map_to_model = self._statement(mode)
+        rows = await (await self._session.execute(sql, params)).fetchall()
+        return rows, model, map_to_model
 
-        if not results or not self._eager_load:
-            return results
-
-        # Load eager relationships
-        self._load_eager_relationships(results)
+    def _model_entities(self) -> List[Type[NexiosModel]]:
+        return [
+            e
+            for e in self.entities
+            if isinstance(e, type) and issubclass(e, NexiosModel)
+        ]
 
-        return results
+    def _eager_relationship_names(self) -> List[str]:
+        """Direct relationships to batch load, including the first hop of
+        nested paths such as ``"posts.comments"``"""
+        names = dict.fromkeys(self._eager_load.get("*", []))
+        names.update(dict.fromkeys(k for k in self._eager_load if k != "*"))
+        return list(names)
+
+    def _nested_eager_query(
+        self, instances: List[Any], rel_name: str
+    ) -> Optional[Tuple[Select, List[Any]]]:
+        """Query that batch loads the next hop of ``rel_name`` on the
+        related objects just loaded for ``instances``"""
+        related: List[Any] = []
+        for instance in instances:
+            value = instance.__dict__.get("__relationship_cache__", {}).get(rel_name)
+            if isinstance(value, list):
+                related.extend(value)
+            elif value is not None:
+                related.append(value)
+        if not related:
+            return None
+
+        query = select(type(related[0])).eager_load(*self._eager_load[rel_name])
+        query._bind(self._session)
+        return query, related
 
     def _load_eager_relationships(self, instances: List[Any]):
         """Load eager relationships for a list of instances"""
@@ -603,38 +715,28 @@ class Select(Generic[_T]):
         if not session:
             return
 
-        # Group relationships by type for batch loading
-        relationships_to_load = defaultdict(list)
-
-        for rel_name in self._eager_load.get("*", []):
-            for instance in instances:
-                relationships_to_load[rel_name].append(instance)
-
-        # Batch load each relationship
-        for rel_name, rel_instances in relationships_to_load.items():
-            if not rel_instances:
+        model_class = type(instances[0])
+        for rel_name in self._eager_relationship_names():
+            rel_info = model_class.__relationships__.get(rel_name)
+            if rel_info is None:
                 continue
 
-            # Get relationship info from first instance
-            first_instance = rel_instances[0]
-            model_class = type(first_instance)
-
-            if rel_name not in model_class.__relationships__:
-                continue
-
-            rel_info = model_class.__relationships__[rel_name]
-
             # Batch load based on relationship type
             if rel_info.relationship_type in (RelationshipType.MANY_TO_ONE, RelationshipType.ONE_TO_ONE):
-                self._batch_load_many_to_one(rel_instances, rel_name, rel_info, session)
+                self._batch_load_many_to_one(instances, rel_name, rel_info, session)
             elif rel_info.relationship_type == RelationshipType.ONE_TO_MANY:
-                self._batch_load_one_to_many(rel_instances, rel_name, rel_info, session)
+                self._batch_load_one_to_many(instances, rel_name, rel_info, session)
+
+            if rel_name in self._eager_load:
+                nested = self._nested_eager_query(instances, rel_name)
+                if nested is not None:
+                    query, related = nested
+                    query._load_eager_relationships(related)
 
     def _batch_load_many_to_one(self, instances, rel_name, rel_info, session: Any):
         """Batch load many-to-one relationships to avoid N+1"""
         # Collect foreign key values
-        fk_values = []
-        instance_map = {}
+        instance_map = defaultdict(list)
         
         is_inverse_one_to_one = rel_info.relationship_type == RelationshipType.ONE_TO_ONE and not rel_info.foreign_key
 
@@ -648,10 +750,9 @@ class Select(Generic[_T]):
         for instance in instances:
             fk_value = getattr(instance, rel_info.foreign_key, None)
             if fk_value is not None:
-                fk_values.append(fk_value)
-                instance_map[fk_value] = instance
+                instance_map[fk_value].append(instance)
 
-        if not fk_values:
+        if not instance_map:
             return
 
         # Fetch all related objects in one query
@@ -659,7 +760,7 @@ class Select(Generic[_T]):
         pk_field = self._get_primary_key_field(related_model)
 
         query = select(related_model).where(
-            getattr(related_model, pk_field).in_(fk_values)
+            getattr(related_model, pk_field).in_(list(instance_map))
         )
         query._bind(session)
 
@@ -668,13 +769,13 @@ class Select(Generic[_T]):
         # Map back to instances
         for obj in related_objects:
             pk_value = getattr(obj, pk_field)
-            if pk_value in instance_map:
-                instance = instance_map[pk_value]
+            for instance in instance_map.get(pk_value, ()):
                 self._set_relationship_cache(instance, rel_name, obj)
 
     def _batch_load_one_to_many(self, instances, rel_name, rel_info, session):
         """Batch load one-to-many relationships to avoid N+1"""
-        if not rel_info.foreign_key:
+        fk_field = self._related_foreign_key(instances[0], rel_name, rel_info)
+        if not fk_field:
             return
 
         # Collect primary key values
@@ -694,7 +795,7 @@ class Select(Generic[_T]):
         related_model = rel_info.related_model
 
         query = select(related_model).where(
-            getattr(related_model, rel_info.foreign_key).in_(pk_values)
+            getattr(related_model, fk_field).in_(pk_values)
         )
         query._bind(session)
 
@@ -703,57 +804,48 @@ class Select(Generic[_T]):
         # Group by foreign key
         related_by_fk = defaultdict(list)
         for obj in all_related:
-            fk_value = getattr(obj, rel_info.foreign_key)
+            fk_value = getattr(obj, fk_field)
             related_by_fk[fk_value].append(obj)
 
-        # Map back to instances
+        # Map back to instances; an inverse one-to-one holds a single object
+        single = rel_info.relationship_type == RelationshipType.ONE_TO_ONE
         for pk_value, instance in instance_map.items():
-            self._set_relationship_cache(
-                instance, rel_name, related_by_fk.get(pk_value, [])
-            )
+            related = related_by_fk.get(pk_value, [])
+            if single:
+                related = related[0] if related else None
+            self._set_relationship_cache(instance, rel_name, related)
 
     async def _async_load_eager_relationships(self, instances: List[Any]):
         if not instances or not self._eager_load:
             return
-        relationships_to_load = defaultdict(list)
-
-        for rel_name in self._eager_load.get("*", []):
-            for instance in instances:
-                relationships_to_load[rel_name].append(instance)
-
-        for parent_rel, child_rels in self._eager_load.items():
-            if parent_rel == "*":
-                continue
-            for instance in instances:
-                pass
         if not self._session:
             raise ValueError("Session not bound to query.")
 
-        for rel_name, rel_instances in relationships_to_load.items():
-            if not rel_instances:
-                continue
-
-            firs_instance = rel_instances[0]
-            model_class = type(firs_instance)
-
-            if rel_name not in model_class.__relationships__:
+        model_class = type(instances[0])
+        for rel_name in self._eager_relationship_names():
+            rel_info = model_class.__relationships__.get(rel_name)
+            if rel_info is None:
                 continue
 
-            rel_info = model_class.__relationships__[rel_name]
-
             if rel_info.relationship_type in (RelationshipType.MANY_TO_ONE, RelationshipType.ONE_TO_ONE):
                 await self._async_batch_load_many_to_one(
-                    rel_instances, rel_name, rel_info, self._session
+                    instances, rel_name, rel_info, self._session
                 )
             elif rel_info.relationship_type == RelationshipType.ONE_TO_MANY:
                 await self._async_batch_load_one_to_many(
-                    rel_instances, rel_name, rel_info, self._session
+                    instances, rel_name, rel_info, self._session
                 )
             elif rel_info.relationship_type == RelationshipType.MANY_TO_MANY:
                 await self._async_batch_load_many_to_many(
-                    rel_instances, rel_name, rel_info, self._session
+                    instances, rel_name, rel_info, self._session
                 )
 
+            if rel_name in self._eager_load:
+                nested = self._nested_eager_query(instances, rel_name)
+                if nested is not None:
+                    query, related = nested
+                    await query._async_load_eager_relationships(related)
+
     async def _async_batch_load_many_to_one(
         self, instances, rel_name, rel_info, session
     ):
@@ -766,36 +858,35 @@ class Select(Generic[_T]):
         if not rel_info.foreign_key:
             return
 
-        fk_values = []
-        instance_map = {}
+        instance_map = defaultdict(list)
 
         for instance in instances:
             fk_value = getattr(instance, rel_info.foreign_key, None)
             if fk_value is not None:
-                fk_values.append(fk_value)
-                instance_map[fk_value] = instance
+                instance_map[fk_value].append(instance)
 
-        if not fk_values:
+        if not instance_map:
             return
 
         related_model = rel_info.related_model
         pk_field = self._get_primary_key_field(related_model)
 
         query = select(related_model).where(
-            getattr(related_model, pk_field).in_(fk_values)
+            getattr(related_model, pk_field).in_(list(instance_map))
         )
+        query._bind(session)
         related_objects = await query._all_async()
 
         for obj in related_objects:
             pk_value = getattr(obj, pk_field)
-            if pk_value in instance_map:
-                instance = instance_map[pk_value]
+            for instance in instance_map.get(pk_value, ()):
                 self._set_relationship_cache(instance, rel_name, obj)
 
     async def _async_batch_load_one_to_many(
         self, instances, rel_name, rel_info, session
     ):
-        if not rel_info.foreign_key:
+        fk_field = self._related_foreign_key(instances[0], rel_name, rel_info)
+        if not fk_field:
             return
 
         pk_values = []
@@ -813,20 +904,23 @@ class Select(Generic[_T]):
         related_model = rel_info.related_model
 
         query = select(related_model).where(
-            getattr(related_model, rel_info.foreign_key).in_(pk_values)
+            getattr(related_model, fk_field).in_(pk_values)
         )
+        query._bind(session)
 
         all_related = await query._all_async()
 
         related_by_fk = defaultdict(list)
         for obj in all_related:
-            fk_value = getattr(obj, rel_info.foreign_key)
+            fk_value = getattr(obj, fk_field)
             related_by_fk[fk_value].append(obj)
 
+        single = rel_info.relationship_type == RelationshipType.ONE_TO_ONE
         for pk_value, instance in instance_map.items():
-            self._set_relationship_cache(
-                instance, rel_name, related_by_fk.get(pk_value, [])
-            )
+            related = related_by_fk.get(pk_value, [])
+            if single:
+                related = related[0] if related else None
+            self._set_relationship_cache(instance, rel_name, related)
 
     async def _async_batch_load_many_to_many(
         self, instances, rel_name, rel_info, session
@@ -855,6 +949,7 @@ class Select(Generic[_T]):
         query1 = select(getattr(through_model, foreign_col)).where(
             getattr(through_model, local_col).in_(pk_values)
         )
+        query1._bind(session)
         rows = await query1._all_async()
 
         for row in rows:
@@ -878,6 +973,7 @@ class Select(Generic[_T]):
             getattr(related_model, "id").in_(list(all_related_ids))
         )
 
+        query2._bind(session)
         all_related = await query2._all_async()
 
         # Create mapping of ID -> related object
@@ -894,45 +990,41 @@ class Select(Generic[_T]):
     # Sync methods
     def _all(self) -> List[_T]:
         """Execute and return all results"""
-        from nexios.orm.model import NexiosModel
-
+        rows, model, map_to_model = self._execute_sync()
+        results = self._rows_to_models(rows, model, map_to_model, self._model_entities())
         if self._eager_load:
-            return self._execute_with_eager_loading(self._execute_sync)
+            self._load_eager_relationships(results)
+        return results
 
-        rows = self._execute_sync()
-        if self._session:
-            sql, params, model, map_to_model = self._build_sql(
-                self._session.engine.dialect, self._session.engine.driver
-            )
-            model_entities = [
-                e
-                for e in self.entities
-                if isinstance(e, type) and issubclass(e, NexiosModel)
-            ]
-            return self._rows_to_models(rows, model, map_to_model, model_entities)
-        else:
-            raise ValueError("Session not bound to query.")
+    def _iter(self, batch_size: int = 1000) -> Iterator[_T]:
+        """Execute and yield results, fetching ``batch_size`` rows at a time.
+
+        The session's cursor stays on this result until iteration ends, so
+        other queries on the same session must wait until then.
+        """
+        self._check_streamable()
+        if not self._session or not isinstance(self._session, Session):
+            raise ValueError("No sync session bound to this query")
+
+        sql, params, model, map_to_model = self._statement("normal")
+        cursor = self._session.execute(sql, params)
+        model_entities = self._model_entities()
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from self._rows_to_models(rows, model, map_to_model, model_entities)
 
     def _first(self) -> Optional[_T]:
         """Execute and return first result - OPTIMIZED"""
-        from nexios.orm.model import NexiosModel
-
         original_limit = self._limit
         self._limit = 1
 
         try:
-            rows = self._execute_sync()
-            if not self._session:
-                raise ValueError("Session not bound to query.")
-            sql, params, model, map_to_model = self._build_sql(
-                self._session.engine.dialect, self._session.engine.driver
-            )
-            model_entities = [
-                e
-                for e in self.entities
-                if isinstance(e, type) and issubclass(e, NexiosModel)
-            ]
-            results = self._rows_to_models(rows, model, map_to_model, model_entities)
+            rows, model, map_to_model = self._execute_sync()
+            results = self._rows_to_models(rows, model, map_to_model, self._model_entities())
+            if self._eager_load:
+                self._load_eager_relationships(results)
             return results[0] if results else None
         finally:
             self._limit = original_limit
@@ -940,46 +1032,46 @@ class Select(Generic[_T]):
     # Async methods
     async def _all_async(self) -> List[_T]:
         """Execute and return all results asynchronously"""
-        from nexios.orm.model import NexiosModel
-
-        rows = await self._execute_async()
-        if not self._session:
-            raise ValueError("Session not bound to query.")
-
-        sql, params, model, map_to_model = self._build_sql(
-            self._session.engine.dialect, self._session.engine.driver
-        )
-        model_entities = [
-            a
-            for a in self.entities
-            if isinstance(a, type) and issubclass(a, NexiosModel)
-        ]
-        results = self._rows_to_models(rows, model, map_to_model, model_entities)
+        rows, model, map_to_model = await self._execute_async()
+        results = self._rows_to_models(rows, model, map_to_model, self._model_entities())
 
         if self._eager_load:
             await self._async_load_eager_relationships(results)
         return results
 
+    async def _iter_async(self, batch_size: int = 1000) -> AsyncIterator[_T]:
+        """Async counterpart of :meth:`_iter`"""
+        self._check_streamable()
+        if not self._session or not isinstance(self._session, AsyncSession):
+            raise ValueError("No async session bound to this query")
+
+        sql, params, model, map_to_model = self._statement("normal")
+        cursor = await self._session.execute(sql, params)
+        model_entities = self._model_entities()
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for result in self._rows_to_models(rows, model, map_to_model, model_entities):
+                yield result
+
+    def _check_streamable(self):
+        # Eager loading runs its own queries on the session cursor, which
+        # would discard the rows still being streamed
+        if self._eager_load:
+            raise ValueError(
+                "eager_load() cannot be combined with streaming; "
+                "use session.preload() once the results are collected"
+            )
+
     async def _first_async(self) -> Optional[_T]:
         """Execute and return first result asynchronously - OPTIMIZED"""
-        from nexios.orm.model import NexiosModel
-
         original_limit = self._limit
         self._limit = 1
 
         try:
-            rows = await self._execute_async()
-            if not self._session:
-                raise ValueError("Session not bound to query.")
-            sql, params, model, map_to_model = self._build_sql(
-                self._session.engine.dialect, self._session.engine.driver
-            )
-            model_entities = [
-                a
-                for a in self.entities
-                if isinstance(a, type) and issubclass(a, NexiosModel)
-            ]
-            results = self._rows_to_models(rows, model, map_to_model, model_entities)
+            rows, model, map_to_model = await self._execute_async()
+            results = self._rows_to_models(rows, model, map_to_model, self._model_entities())
             if self._eager_load:
                 await self._async_load_eager_relationships(results)
             return results[0] if results else None
@@ -1002,79 +1094,63 @@ class Select(Generic[_T]):
 
         if map_to_model:
             # assume columns for the primary model come first in the result set
-            field_names = list(model.get_fields().keys())
-            n = len(field_names)
-            for row in rows:
-                values = row[:n]
-                data = {name: val for name, val in zip(field_names, values)}
-                # prefer pydantic-style parsing if provided
-                if hasattr(model, "model_validate"):
-                    inst = model.model_validate(data)
-                else:
-                    inst = model(**data)
-                results.append(inst)
-            return results
+            field_names = model.get_field_names()
+            validate = self._get_row_validator(model)
+            # zip() stops at the last model column, so no per-row slice is needed
+            return [validate(dict(zip(field_names, row))) for row in rows]
         elif len(model_entities) > 1:
-            model_field_counts = []
+            # (field names, validator, first column, past-last column) per model
+            layout = []
+            start_idx = 0
             for model_cls in model_entities:
-                model_field_counts.append(len(model_cls.get_fields()))
-
-            for row in rows:
-                model_instances = []
-                start_idx = 0
-
-                for i, model_cls in enumerate(model_entities):
-                    field_count = model_field_counts[i]
-                    model_slice = row[start_idx : start_idx + field_count]
-
-                    field_names = list(model_cls.get_fields().keys())
-                    data = {name: val for name, val in zip(field_names, model_slice)}
-
-                    if hasattr(model_cls, "model_validate"):
-                        inst = model_cls.model_validate(data)
-                    else:
-                        inst = model_cls(**data)
+                field_names = model_cls.get_field_names()
+                stop_idx = start_idx + len(field_names)
+                layout.append(
+                    (field_names, self._get_row_validator(model_cls), start_idx, stop_idx)
+                )
+                start_idx = stop_idx
 
-                    model_instances.append(inst)
-                    start_idx += field_count
-                results.append(tuple(model_instances))
-            return results
+            return [
+                tuple(
+                    validate(dict(zip(field_names, row[start:stop])))
+                    for field_names, validate, start, stop in layout
+                )
+                for row in rows
+            ]
         else:
             # Not mapping to a model: return scalar for single-column selects, else tuples
-            for row in rows:
-                if len(row) == 1:
-                    results.append(row[0])
-                else:
-                    results.append(row)
-            return results
+            return [row[0] if len(row) == 1 else row for row in rows]
     
+    @staticmethod
+    def _get_row_validator(model: Type[NexiosModel]) -> Callable[[Dict[str, Any]], Any]:
+        """Return a callable that builds a model instance from a row dict.
+
+        Uses the model's compiled pydantic validator directly so the
+        lookup happens once per result set rather than once per row.
+        """
+        validator = getattr(model, "__pydantic_validator__", None)
+        if validator is not None and hasattr(validator, "validate_python"):
+            return validator.validate_python
+        return lambda data: model(**data)
+
     def _get_primary_key_field(self, model: InstanceOrType[NexiosModel]) -> Any:
-        pk_field = model.get_primary_key()
-        return pk_field[0] if isinstance(pk_field, (list, tuple)) else pk_field
+        return model.__pk_field__
     
+    def _related_foreign_key(self, instance: Any, rel_name: str, rel_info: Any) -> Optional[str]:
+        """Foreign-key column on the related side of a to-many relationship"""
+        if rel_info.foreign_key:
+            return rel_info.foreign_key
+        descriptor = getattr(type(instance), rel_name, None)
+        if not isinstance(descriptor, RelationshipDescriptor) or rel_info.related_model is None:
+            return None
+        return descriptor._find_foreign_key_on_related(rel_info.related_model, type(instance))
+
     def _set_relationship_cache(self, instance: Any, rel_name: str, value: Any):
         """Set the relationship cache for an instance"""
         if "__relationship_cache__" not in instance.__dict__:
             instance.__dict__["__relationship_cache__"] = {}
         instance.__dict__["__relationship_cache__"][rel_name] = value
 
-    def _clone(self) -> "Select[_T]":
-        """Create a copy of the current Select instance"""
-        new_select = Select(*self.entities)
-        new_select._where = self._where[:]
-        new_select._params = self._params[:]
-        new_select._order_by = self._order_by[:]
-        new_select._limit = self._limit
-        new_select._offset = self._offset
-        new_select._session = self._session
-        new_select._joins = self._joins[:]
-        new_select._distinct = self._distinct
-        new_select._group_by = self._group_by[:]
-        new_select._having = self._having[:]
-        new_select._table_aliases = self._table_aliases.copy()
-        new_select._alias_counter = self._alias_counter
-        return new_select
-
 
 @overload
 def select(entity: Type[_T]) -> Select[_T]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Generic, List, Optional, Self, Tuple, Type, TypeVar, Union, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Optional, Self, Tuple, Type, TypeVar, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nexios.orm.config import Dialect
@@ -12,9 +13,17 @@ Expression = Union["BinaryExpression", "CompoundExpression"]
 _T = TypeVar("_T", bound="NexiosModel")
 
 
+@lru_cache(maxsize=1024)
+def _in_placeholders(placeholder: str, count: int) -> str:
+    # IN lists of a given size recur across queries; join each size once
+    return ", ".join([placeholder] * count)
+
+
 class CompoundExpression:
     """Represents AND/OR combination of expressions"""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, operator: str, right: Expression):
         self.left = left
         self.operator = operator  # 'AND' or 'OR'
@@ -27,10 +36,14 @@ class CompoundExpression:
         return CompoundExpression(self, "OR", other)
 
     def to_sql(
-        self, placeholder: str = "?", dialect: Optional[Any] = None, driver: Optional[Any] = None
+        self,
+        placeholder: str = "?",
+        dialect: Optional[Any] = None,
+        driver: Optional[Any] = None,
+        table_aliases: Optional[Dict[Any, str]] = None,
     ) -> Tuple[str, List[Any]]:
-        left_sql, left_params = self.left.to_sql(placeholder, dialect, driver)
-        right_sql, right_params = self.right.to_sql(placeholder, dialect, driver)
+        left_sql, left_params = self.left.to_sql(placeholder, dialect, driver, table_aliases)
+        right_sql, right_params = self.right.to_sql(placeholder, dialect, driver, table_aliases)
 
         sql = f"({left_sql} {self.operator} {right_sql})"
         params = left_params + right_params
@@ -38,6 +51,8 @@ class CompoundExpression:
 
 
 class TSVectorExpression:
+    __slots__ = ("column", "query", "config")
+
     def __init__(
         self, column: ColumnExpression, query: str, config: Optional[str] = None
     ):
@@ -59,6 +74,8 @@ class TSVectorExpression:
 
 
 class MatchExpression:
+    __slots__ = ("column", "query", "mode")
+
     def __init__(self, column: ColumnExpression, query: str, mode: str = "BOOLEAN"):
         self.column = column
         self.query = query
@@ -77,6 +94,8 @@ class MatchExpression:
 
 
 class BM25Expression:
+    __slots__ = ("column", "query")
+
     def __init__(self, column: ColumnExpression, query: str):
         self.column = column
         self.query = query
@@ -88,17 +107,111 @@ class BM25Expression:
         return f"{quoted_column} MATCH {placeholder}", [self.query]
 
 
+class GenericMatch:
+    """Full-text match rendered with the session dialect's search syntax"""
+
+    __slots__ = ("_column", "_query", "_mode")
+
+    def __init__(self, c, q, m):
+        self._column = c
+        self._query = q
+        self._mode = m
+
+    def to_sql(
+        self, placeholder: str = "?", dialect: Optional[Dialect] = None
+    ) -> tuple[str, list[Any]]:
+        from nexios.orm.config import PostgreSQLDialect, MySQLDialect, SQLiteDialect
+
+        if isinstance(dialect, PostgreSQLDialect):
+            return TSVectorExpression(self._column, self._query).to_sql(
+                placeholder, dialect
+            )
+        elif isinstance(dialect, MySQLDialect):
+            return MatchExpression(self._column, self._query).to_sql(
+                placeholder, dialect
+            )
+        elif isinstance(dialect, SQLiteDialect):
+            return BM25Expression(self._column, self._query).to_sql(
+                placeholder, dialect
+            )
+        else:
+            raise NotImplementedError()
+
+
+class BindParam:
+    """A named parameter whose value is supplied at execution time.
+
+    The compiled SQL only records the placeholder, so a statement built
+    with bind parameters can be re-executed with new values via
+    ``Select.params()`` without being rendered again.
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str, value: Any = None):
+        self.name = name
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"BindParam({self.name!r}, {self.value!r})"
+
+    def resolve(self, values: Dict[str, Any]) -> Any:
+        return values.get(self.name, self.value)
+
+
+class _ComparedBindParam(BindParam):
+    """A BindParam on the right of ``=``/``!=``. Those render ``IS NULL``
+    for a literal None, which a placeholder cannot do, so binding None is
+    rejected instead of silently matching nothing."""
+
+    __slots__ = ("operator",)
+
+    def __init__(self, bind: BindParam, operator: str):
+        super().__init__(bind.name, bind.value)
+        self.operator = operator
+
+    def resolve(self, values: Dict[str, Any]) -> Any:
+        value = values.get(self.name, self.value)
+        if value is None:
+            method = "is_null()" if self.operator == "=" else "is_not_null()"
+            raise ValueError(
+                f"bindparam({self.name!r}) is compared with {self.operator} and "
+                f"bound to None; use {method} to match NULL"
+            )
+        return value
+
+
+def bindparam(name: str, value: Any = None) -> Any:
+    """Create a named bind parameter, e.g. ``User.id == bindparam("uid")``"""
+    return BindParam(name, value)
+
+
+def resolve_bind_params(params: Tuple[Any, ...], values: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Replace BindParam placeholders in ``params`` with their bound values"""
+    return tuple(
+        p.resolve(values) if isinstance(p, BindParam) else p for p in params
+    )
+
+
 class AlwaysTrueExpression:
     """An expression that's always true"""
-    def to_sql(self, placeholder: str = "?", dialect=None, driver=None) -> Tuple[str, List[Any]]:
+
+    __slots__ = ()
+
+    def to_sql(self, placeholder: str = "?", dialect=None, driver=None, table_aliases=None) -> Tuple[str, List[Any]]:
         return "1 = 1", []
 
 class AlwaysFalseExpression:
     """An expression that's always false"""
-    def to_sql(self, placeholder: str = "?", dialect=None, driver=None) -> Tuple[str, List[Any]]:
+
+    __slots__ = ()
+
+    def to_sql(self, placeholder: str = "?", dialect=None, driver=None, table_aliases=None) -> Tuple[str, List[Any]]:
         return "1 = 0", []
 
 class BinaryExpression:  # type: ignore
+    __slots__ = ("column", "operator", "value")
+
     def __init__(self, column_expr: ColumnExpression, operator: str, value: Any):
         self.column = column_expr
         self.operator = operator
@@ -115,63 +228,122 @@ class BinaryExpression:  # type: ignore
         placeholder: str = "?",
         dialect: Optional[Any] = None,
         driver: Optional[Any] = None,
+        table_aliases: Optional[Dict[Any, str]] = None,
     ) -> Tuple[str, List[Any]]:
-        from nexios.orm.query.builder import Select
-
-        col = self.column.field_name
-        if self.value is None:
-            if self.operator == "=":
-                return f"{col} IS NULL", []
-            if self.operator == "!=":
-                return f"{col} IS NOT NULL", []
-
-        if isinstance(self.value, ColumnExpression):
-            right_col = self.value.field_name
+        """Render the condition. With ``table_aliases`` (queries with joins)
+        columns are quoted and qualified by their table alias."""
+        if table_aliases is None:
+            col = self.column.field_name
+        else:
+            col = self.column._qualified_name(dialect, table_aliases)
+
+        value = self.value
+        if value is None:
+            null_sql = _NULL_TEMPLATES.get(self.operator)
+            if null_sql is not None:
+                return null_sql.format(col), []
+
+        # Column-to-column comparisons (join keys) are SQL text, not parameters
+        if isinstance(value, ColumnExpression):
+            if table_aliases is None:
+                right_col = value.field_name
+            else:
+                right_col = value._qualified_name(dialect, table_aliases)
             return f"{col} {self.operator} {right_col}", []
 
-        if self.operator in ("IN", "NOT IN"):
-            if isinstance(self.value, Select):
-                subquery_sql, subquery_params, _, _ = self.value._build_sql(
-                    dialect, driver # type: ignore
+        # The value arrives at execution time; keep the placeholder generic
+        if isinstance(value, BindParam):
+            if self.operator in _OP_RENDERERS:
+                raise ValueError(
+                    f"bindparam() cannot stand for the whole {self.operator} operand; "
+                    "pass the value directly or bind its items individually"
                 )
-                return f"{col} {self.operator} ({subquery_sql})", subquery_params
+            if self.operator in _NULL_TEMPLATES:
+                value = _ComparedBindParam(value, self.operator)
+            return f"{col} {self.operator} {placeholder}", [value]
 
-            if not isinstance(self.value, (list, tuple)):
-                raise ValueError(f"{self.operator} requires a list or tuple")
+        render = _OP_RENDERERS.get(self.operator, _render_binary)
+        return render(col, self.operator, value, placeholder, dialect, driver)
 
-            if not self.value:
-                if self.operator == "IN":
-                    return "1 = 0", []
-                else:
-                    return "1 = 1", []
 
-            placeholders = ", ".join([placeholder] * len(self.value))
-            return f"{col} {self.operator} ({placeholders})", list(self.value)
+_NULL_TEMPLATES = {"=": "{} IS NULL", "!=": "{} IS NOT NULL"}
 
-        if self.operator == "BETWEEN":
-            if not isinstance(self.value, (list, tuple)) or len(self.value) != 2:
-                raise ValueError("BETWEEN requires a 2-tuple (lower, upper)")
 
-            return f"{col} BETWEEN {placeholder} AND {placeholder}", list(self.value)
+def _render_binary(
+    col: str, operator: str, value: Any, placeholder: str, dialect: Any, driver: Any
+) -> Tuple[str, List[Any]]:
+    return f"{col} {operator} {placeholder}", [value]
 
-        if self.operator in ("LIKE", "ILIKE"):
-            value = str(self.value)
-            if "%" not in value and "_" not in value:
-                value = f"%{value}%"
 
-            return f"{col} {self.operator} {placeholder}", [value]
+def _render_in(
+    col: str, operator: str, value: Any, placeholder: str, dialect: Any, driver: Any
+) -> Tuple[str, List[Any]]:
+    from nexios.orm.query.builder import Select
+
+    if isinstance(value, Select):
+        subquery_sql, subquery_params, _, _ = value._build_sql(dialect, driver)
+        return f"{col} {operator} ({subquery_sql})", list(subquery_params)
+
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{operator} requires a list or tuple")
+
+    if not value:
+        return ("1 = 0", []) if operator == "IN" else ("1 = 1", [])
+
+    placeholders = _in_placeholders(placeholder, len(value))
+    return f"{col} {operator} ({placeholders})", list(value)
+
 
-        return f"{col} {self.operator} {placeholder}", [self.value]
+def _render_between(
+    col: str, operator: str, value: Any, placeholder: str, dialect: Any, driver: Any
+) -> Tuple[str, List[Any]]:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError("BETWEEN requires a 2-tuple (lower, upper)")
+
+    return f"{col} BETWEEN {placeholder} AND {placeholder}", list(value)
+
+
+def _render_like(
+    col: str, operator: str, value: Any, placeholder: str, dialect: Any, driver: Any
+) -> Tuple[str, List[Any]]:
+    value = str(value)
+    if "%" not in value and "_" not in value:
+        value = f"%{value}%"
+
+    return f"{col} {operator} {placeholder}", [value]
+
+
+def _snapshot_values(values: Any) -> Any:
+    """Copy a list operand so later changes to the caller's list cannot
+    desync a Select's compiled SQL from its parameters"""
+    if isinstance(values, list):
+        return tuple(values)
+    return values
+
+
+# One dict lookup per condition instead of a chain of operator tests
+_OP_RENDERERS = {
+    "IN": _render_in,
+    "NOT IN": _render_in,
+    "BETWEEN": _render_between,
+    "LIKE": _render_like,
+    "ILIKE": _render_like,
+}
 
 
 class ColumnExpression(Generic[_T]):
     """Represents a column in a select expression"""
 
+    __slots__ = ("model_cls", "field_name", "_alias", "_order_desc", "_sql_cache")
+
     def __init__(self, model_cls: Type[_T], field_name: str):
         self.model_cls = model_cls
         self.field_name = field_name
         self._alias = None
         self._order_desc = False
+        # (dialect type, table alias) -> rendered column; the inputs never
+        # change after construction, except _alias which label() copies
+        self._sql_cache: Dict[Tuple[Any, Optional[str]], str] = {}
 
     def _binary(self, operator: str, value: Any) -> BinaryExpression:
         return BinaryExpression(self, operator, value)
@@ -202,10 +374,10 @@ class ColumnExpression(Generic[_T]):
 
     def in_(self, values: Union[List[Any], Select]):
         """IN operator for list values or subquery"""
-        return self._binary("IN", values)
+        return self._binary("IN", _snapshot_values(values))
 
     def not_in(self, values: Union[List[Any], Select]):
-        return self._binary("NOT IN", values)
+        return self._binary("NOT IN", _snapshot_values(values))
 
     def between(self, lower: Any, upper: Any) -> BinaryExpression:
         """BETWEEN operator"""
@@ -239,12 +411,32 @@ class ColumnExpression(Generic[_T]):
 
     def label(self, alias: str) -> ColumnExpression[_T]:
         """Create an aliased column expression"""
-        # For simplicity, we'll handle aliasing in the SQL builder
-        self._alias = alias
-        return self
+        # Column expressions are shared per model field, so aliasing
+        # must not mutate the original
+        import copy
+
+        new_expr = copy.copy(self)
+        new_expr._alias = alias
+        new_expr._sql_cache = {}
+        return new_expr
 
     def to_sql(self, dialect: Dialect, table_alias: Optional[str] = None) -> str:
         """Generate SQL with proper quoting and table qualification"""
+        key = (type(dialect), table_alias)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            sql = self._sql_cache[key] = self._render(dialect, table_alias)
+        return sql
+
+    def _qualified_name(self, dialect: Dialect, table_aliases: Dict[Any, str]) -> str:
+        """Quoted ``table.column`` for conditions, ignoring any label"""
+        table_alias = table_aliases.get(self.model_cls, self.model_cls.__tablename__)
+        if self._alias is None:
+            return self.to_sql(dialect, table_alias)
+        quote = dialect.quote_identifier
+        return f"{quote(table_alias)}.{quote(self.field_name)}"
+
+    def _render(self, dialect: Dialect, table_alias: Optional[str]) -> str:
         quoted_field = dialect.quote_identifier(self.field_name)
 
         if table_alias:
@@ -262,34 +454,8 @@ class ColumnExpression(Generic[_T]):
         return sql
 
     def match(self, query: str, mode: str = "NATURAL"):
-        from nexios.orm.config import PostgreSQLDialect, MySQLDialect, SQLiteDialect
-
-        class GenericMatch:
-            def __init__(self, c, q, m):
-                self._column = c
-                self._query = q
-                self._mode = m
-
-            def to_sql(
-                self, placeholder: str = "?", dialect: Optional[Dialect] = None
-            ) -> tuple[str, list[Any]]:
-                if isinstance(dialect, PostgreSQLDialect):
-                    return TSVectorExpression(self._column, self._query).to_sql(
-                        placeholder, dialect
-                    )
-                elif isinstance(dialect, MySQLDialect):
-                    return MatchExpression(self._column, self._query).to_sql(
-                        placeholder, dialect
-                    )
-                elif isinstance(dialect, SQLiteDialect):
-                    return BM25Expression(self._column, self._query).to_sql(
-                        placeholder, dialect
-                    )
-                else:
-                    raise NotImplementedError()
-
         return GenericMatch(self, query, mode)
 
     def __str__(self) -> str:
-        return f"{self.field_name}"
+        return self.field_name
 
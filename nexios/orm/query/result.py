@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, List, Optional, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Generic, Iterator, List, Optional, TypeVar
 from nexios.orm.query.builder import Select
 from nexios.orm.sessions import Session, AsyncSession
 
@@ -13,6 +13,8 @@ _T = TypeVar("_T", bound="NexiosModel")
 class ResultSet(Generic[_T]):
     """Base class for result sets"""
 
+    __slots__ = ("statement",)
+
     def __init__(self, statement: Select[_T]) -> None:
         self.statement = statement
 
@@ -31,10 +33,15 @@ class ResultSet(Generic[_T]):
     def exists(self) -> bool:
         raise NotImplementedError
 
+    def stream(self, batch_size: int = 1000):
+        raise NotImplementedError
+
 
 class SyncResultSet(ResultSet[_T]):
     """Synchronous result set"""
 
+    __slots__ = ()
+
     def __init__(self, statement: Select[_T], session: Session) -> None:
         super().__init__(statement)
         self.statement._bind(session)
@@ -57,10 +64,16 @@ class SyncResultSet(ResultSet[_T]):
     def exists(self) -> bool:
         return self.statement._exists()
 
+    def stream(self, batch_size: int = 1000) -> Iterator[_T]:
+        """Yield results while fetching ``batch_size`` rows at a time"""
+        return self.statement._iter(batch_size)
+
 
 class AsyncResultSet(ResultSet[_T]):
     """Asynchronous result set"""
 
+    __slots__ = ()
+
     def __init__(self, statement: Select[_T], session: AsyncSession) -> None:
         super().__init__(statement)
         self.statement._bind(session)
@@ -82,3 +95,7 @@ class AsyncResultSet(ResultSet[_T]):
 
     async def exists(self) -> bool:  # type: ignore[override]
         return await self.statement._async_exists()
+
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[_T]:
+        """Yield results while fetching ``batch_size`` rows at a time"""
+        return self.statement._iter_async(batch_size)
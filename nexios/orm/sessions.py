@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Tuple, TypeVar, Optional, Type, List
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, AsyncContextManager, ContextManager, Iterable, Tuple, TypeVar, Optional, Type, List
 
 from nexios.orm.connection import (
     AsyncDatabaseConnection,
@@ -9,7 +10,7 @@ from nexios.orm.connection import (
     AsyncCursor,
     SyncDatabaseConnection,
 )
-from nexios.orm.misc.context import set_context_data, reset_context_data
+from nexios.orm.misc.context import context_data
 
 if TYPE_CHECKING:
     from nexios.orm.engine import Engine
@@ -18,9 +19,40 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T", bound="NexiosModel")
 
+# Active session, read by lazy relationship loads in descriptors.py
+_session_context = context_data("session")
+
+
+def _needs_generated_key(instance: NexiosModel) -> bool:
+    if not instance.__pk_auto_increment__:
+        return False
+    value = getattr(instance, instance.__pk_field__, None)
+    return value is None or isinstance(value, int) and value <= 0
+
+
+def _refresh_query(model: _T) -> Tuple[Select[_T], str]:
+    """SELECT for ``model``'s row by primary key, and a label for errors"""
+    from nexios.orm.query.builder import select
+
+    model_class = type(model)
+    primary_key = model_class.get_primary_key()
+    pk_fields = primary_key if isinstance(primary_key, tuple) else (primary_key,)
+    pk_values = [getattr(model, field, None) for field in pk_fields]
+    if None in pk_values:
+        raise ValueError(f"Cannot refresh {model_class.__name__}:primary key is None")
+
+    query = select(model_class).where(
+        *(getattr(model_class, f) == v for f, v in zip(pk_fields, pk_values))
+    )
+    label = ", ".join(f"{f}={v}" for f, v in zip(pk_fields, pk_values))
+    return query, label
+
+
 class Session:
     """Synchronous session managing a database transaction.""" 
 
+    __slots__ = ("engine", "connection", "_cursor", "logger", "_ddl", "_echo", "_token")
+
     def __init__(self, engine: Engine, logger: Optional[logging.Logger] = None):
         from nexios.orm.config import DDLGenerator
 
@@ -29,6 +61,8 @@ class Session:
         self._cursor: Optional[SyncCursor] = None
         self.logger = logger or logging.getLogger(__name__)
         self._ddl = DDLGenerator(engine.dialect, self.engine.driver)
+        # Read once; sessions are short-lived and execute() is the hot path
+        self._echo = engine.echo
 
         self._token = None
 
@@ -43,7 +77,7 @@ class Session:
         """Explicitly open a connection and cursor outside a context manager."""
         if self.connection is None:
             self.connection = self.engine.connect()
-            self._cursor = self.engine.sync_cursor()
+            self._cursor = self.connection.default_cursor()
         return self
 
     def close(self):
@@ -55,7 +89,7 @@ class Session:
 
     def __enter__(self):
         sess = self.connect()
-        self._token = set_context_data("session", sess)
+        self._token = _session_context.set(sess)
         return sess
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -71,19 +105,22 @@ class Session:
                 self.close()
 
                 if self._token:
-                    reset_context_data("session", self._token)
+                    _session_context.reset(self._token)
+
+    def _pipeline(self) -> ContextManager[Any]:
+        return self.connection.pipeline() if self.connection else nullcontext()
 
     def exec(self, statement: Select[_T]):
         from nexios.orm.query.result import SyncResultSet
         return SyncResultSet(statement, self)
 
     def execute(self, sql: str, params: tuple = ()):
-        if self.engine.echo:
+        if self._echo:
             print("SQL:", sql, "params:", params)
         return self.cursor.execute(sql, params)
     
     def executemany(self, sql: str, params: List[Tuple[Any, ...]]):
-        if self.engine.echo:
+        if self._echo:
             print("SQL:", sql, "params:", params)
         return self.cursor.executemany(sql, params)
 
@@ -96,22 +133,13 @@ class Session:
             self.connection.rollback()
 
     def add(self, instance: _T):
-        from nexios.orm.query.expressions import ColumnExpression
         from nexios.orm.config import MySQLDialect, SQLiteDialect, PostgreSQLDialect
 
         sql, params = self._ddl.upsert(instance)
 
-        primary_key = self._ddl._get_primary_key(instance)
-
-        if isinstance(primary_key, ColumnExpression):
-            primary_key_field = primary_key.field_name
-        else:
-            primary_key_field = primary_key
-        
-        fields = instance.get_fields()
-        field_info = fields.get(primary_key_field)
-        auto_increment = getattr(field_info, 'auto_increment', False) if field_info else False
-        if auto_increment:
+        # Resolved once per class by the model metaclass
+        primary_key_field = instance.__pk_field__
+        if instance.__pk_auto_increment__:
             if isinstance(self._ddl.dialect, SQLiteDialect):
                 self.execute(sql, params)
                 result = self.execute("SELECT last_insert_rowid()").fetchone()
@@ -129,7 +157,44 @@ class Session:
                 self.execute(sql, params)
         else:
             self.execute(sql, params)
+
+    def add_all(self, instances: Iterable[_T]):
+        """Add many instances, sending consecutive rows that share a statement
+        through a single executemany. Rows whose primary key the database
+        generates are added one by one so the key can be read back."""
+        batch_sql: Optional[str] = None
+        batch: List[Tuple[Any, ...]] = []
+
+        for instance in instances:
+            if _needs_generated_key(instance):
+                if batch:
+                    self.executemany(batch_sql, batch)
+                    batch_sql, batch = None, []
+                self.add(instance)
+                continue
+
+            sql, params = self._ddl.upsert(instance)
+            if sql != batch_sql and batch:
+                self.executemany(batch_sql, batch)
+                batch = []
+            batch_sql = sql
+            batch.append(params)
+
+        if batch:
+            self.executemany(batch_sql, batch)
     
+    def preload(self, instances: Iterable[_T], *relationships: str) -> List[_T]:
+        """Load ``relationships`` for already fetched instances with one IN
+        query per relationship instead of one lazy query per instance."""
+        from nexios.orm.query.builder import select
+
+        instances = list(instances)
+        if instances:
+            query = select(type(instances[0])).eager_load(*relationships)
+            query._bind(self)
+            query._load_eager_relationships(instances)
+        return instances
+
     def delete(self, model: _T):
         sql, params = self._ddl.delete(model)
         self.execute(sql, params)
@@ -137,14 +202,17 @@ class Session:
     def create_all(self, *models: Type[_T]):
         """Create all tables for given models."""
         try:
-            for model in models:
-                sql = self._ddl.create_table(model)
-                # Create tables
-                self.execute(sql)
-                # Create indexes
-                index_sql = self._ddl.create_indexes(model)
-                for idx in index_sql:
-                    self.execute(idx)
+            # DDL results are not read, so drivers that pipeline can send
+            # every statement in one flight
+            with self._pipeline():
+                for model in models:
+                    sql = self._ddl.create_table(model)
+                    # Create tables
+                    self.execute(sql)
+                    # Create indexes
+                    index_sql = self._ddl.create_indexes(model)
+                    for idx in index_sql:
+                        self.execute(idx)
             self.commit()
         except Exception as e:
             self.rollback()
@@ -164,35 +232,21 @@ class Session:
         Args:
             model: Model instance to refresh
         """
-        from nexios.orm.query.expressions import ColumnExpression
-        from nexios.orm.query.builder import select
-
-
-        primary_key = self._ddl._get_primary_key(model)
-        if isinstance(primary_key, ColumnExpression):
-            primary_key_field = primary_key.field_name
-        else:
-            primary_key_field = primary_key
-
-        model_class = type(model)
-        pk_value = getattr(model, primary_key_field, None)
-        if pk_value is None:
-            raise ValueError(f"Cannot refresh {model_class.__name__}:primary key is None")
-
-        query = select(model_class).where(getattr(model_class, primary_key_field) == pk_value)
+        query, key_label = _refresh_query(model)
         refreshed = self.exec(query).first()
 
         if refreshed is None:
-            raise ValueError(f"{model_class.__name__} with {primary_key_field}={pk_value} no longer exists")
+            raise ValueError(f"{type(model).__name__} with {key_label} no longer exists")
 
-        for field_name in model.get_fields().keys():
-            new_value = getattr(refreshed, field_name, None)
+        for field_name, new_value in refreshed.get_field_values().items():
             setattr(model, field_name, new_value)
 
 
 class AsyncSession:
     """Asynchronous session for async database operations."""
 
+    __slots__ = ("engine", "connection", "_cursor", "logger", "_ddl", "_echo", "_token")
+
     def __init__(self, engine: Engine, logger: Optional[logging.Logger] = None):
         from nexios.orm.config import DDLGenerator
         
@@ -201,6 +255,7 @@ class AsyncSession:
         self._cursor: Optional[AsyncCursor] = None
         self.logger = logger or logging.getLogger(__name__)
         self._ddl = DDLGenerator(engine.dialect, self.engine.driver)
+        self._echo = engine.echo
 
         self._token = None
 
@@ -215,7 +270,7 @@ class AsyncSession:
         """Explicitly open an async connection and cursor outside of an async context manager."""
         if self.connection is None:
             self.connection = await self.engine.async_connect()
-            self._cursor = await self.connection.cursor()
+            self._cursor = await self.connection.default_cursor()
         return self
 
     async def close(self):
@@ -227,7 +282,7 @@ class AsyncSession:
 
     async def __aenter__(self):
         sess = await self.connect()
-        self._token = set_context_data("session", sess)
+        self._token = _session_context.set(sess)
         return sess
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -241,19 +296,22 @@ class AsyncSession:
                 await self.close()
 
                 if self._token:
-                    reset_context_data("session", self._token)
+                    _session_context.reset(self._token)
     
+    def _pipeline(self) -> AsyncContextManager[Any]:
+        return self.connection.pipeline() if self.connection else nullcontext()
+
     def exec(self, statement: Select[_T]):
         from nexios.orm.query.result import AsyncResultSet
         return AsyncResultSet(statement, self)
     
     async def execute(self, sql: str, params: tuple = ()):
-        if self.engine.echo:
+        if self._echo:
             print("SQL:", sql, "params:", params)
         return await self.cursor.execute(sql, params)
     
     async def executemany(self, sql: str, params: List[Tuple[Any, ...]]):
-        if self.engine.echo:
+        if self._echo:
             print("SQL:", sql, "params:", params)
         return await self.cursor.executemany(sql, params)
 
@@ -266,21 +324,13 @@ class AsyncSession:
             await self.connection.rollback()
 
     async def add(self, instance: NexiosModel):
-        from nexios.orm.query.expressions import ColumnExpression
         from nexios.orm.config import MySQLDialect, SQLiteDialect, PostgreSQLDialect
 
         sql, params = self._ddl.upsert(instance)
 
-        primary_key = self._ddl._get_primary_key(instance)
-        if isinstance(primary_key, ColumnExpression):
-            primary_key_field = primary_key.field_name
-        else:
-            primary_key_field = primary_key
-
-        fields = instance.get_fields()
-        field_info = fields.get(primary_key_field)
-        auto_increment = getattr(field_info, 'auto_increment', False) if field_info else False
-        if auto_increment:
+        # Resolved once per class by the model metaclass
+        primary_key_field = instance.__pk_field__
+        if instance.__pk_auto_increment__:
             if isinstance(self._ddl.dialect, SQLiteDialect):
                 await self.execute(sql, params)
                 result = await (await self.execute("SELECT last_insert_rowid()")).fetchone()
@@ -299,20 +349,58 @@ class AsyncSession:
         else:
             await self.execute(sql, params)
 
+    async def add_all(self, instances: Iterable[NexiosModel]):
+        """Add many instances, sending consecutive rows that share a statement
+        through a single executemany. Rows whose primary key the database
+        generates are added one by one so the key can be read back."""
+        batch_sql: Optional[str] = None
+        batch: List[Tuple[Any, ...]] = []
+
+        for instance in instances:
+            if _needs_generated_key(instance):
+                if batch:
+                    await self.executemany(batch_sql, batch)
+                    batch_sql, batch = None, []
+                await self.add(instance)
+                continue
+
+            sql, params = self._ddl.upsert(instance)
+            if sql != batch_sql and batch:
+                await self.executemany(batch_sql, batch)
+                batch = []
+            batch_sql = sql
+            batch.append(params)
+
+        if batch:
+            await self.executemany(batch_sql, batch)
+
+    async def preload(self, instances: Iterable[_T], *relationships: str) -> List[_T]:
+        """Load ``relationships`` for already fetched instances with one IN
+        query per relationship instead of one lazy query per instance."""
+        from nexios.orm.query.builder import select
+
+        instances = list(instances)
+        if instances:
+            query = select(type(instances[0])).eager_load(*relationships)
+            query._bind(self)
+            await query._async_load_eager_relationships(instances)
+        return instances
+
     async def delete(self, model: _T):
         sql, params = self._ddl.delete(model)
         await self.execute(sql, params)
 
     async def create_all(self, *models: Type[_T]):
         try:
-            for nexiosmodel in models:
-                sql = self._ddl.create_table(nexiosmodel)
-                # Create tables
-                await self.execute(sql)
-                # Create indexes
-                index_sql = self._ddl.create_indexes(nexiosmodel)
-                for idx in index_sql:
-                    await self.execute(idx)
+            async with self._pipeline():
+                for nexiosmodel in models:
+                    sql = self._ddl.create_table(nexiosmodel)
+                    # Create tables
+                    await self.execute(sql)
+                    # Create indexes
+                    index_sql = self._ddl.create_indexes(nexiosmodel)
+                    for idx in index_sql:
+                        await self.execute(idx)
             await self.commit()
         except Exception as e:
             await self.rollback()
@@ -329,26 +417,11 @@ class AsyncSession:
         Args:
             model: Model instance to refresh
         """
-        from nexios.orm.query.expressions import ColumnExpression
-        from nexios.orm.query.builder import select
-
-        primary_key = self._ddl._get_primary_key(model)
-        if isinstance(primary_key, ColumnExpression):
-            primary_key_field = primary_key.field_name
-        else:
-            primary_key_field = primary_key
-
-        model_class = type(model)
-        pk_value = getattr(model, primary_key_field, None)
-        if pk_value is None:
-            raise ValueError(f"Cannot refresh {model_class.__name__}:primary key is None")
-
-        query = select(model_class).where(getattr(model_class, primary_key_field) == pk_value)
+        query, key_label = _refresh_query(model)
         refreshed = await self.exec(query).first()
 
         if refreshed is None:
-            raise ValueError(f"{model_class.__name__} with {primary_key_field}={pk_value} no longer exists")
+            raise ValueError(f"{type(model).__name__} with {key_label} no longer exists")
 
-        for field_name in model.get_fields().keys():
-            new_value = getattr(refreshed, field_name, None)
+        for field_name, new_value in refreshed.get_field_values().items():
             setattr(model, field_name, new_value)
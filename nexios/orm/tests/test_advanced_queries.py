@@ -231,4 +231,70 @@ class TestAdvancedQueries:
         # query._bind(sync_session)
         results = sync_session.exec(query).all()
         assert len(results) == 1
-        assert results[0].username == "timeuser3"
\ No newline at end of file
+        assert results[0].username == "timeuser3"
+
+    def test_bind_params(self, sync_session):
+        """Test re-executing a query with bindparam() values"""
+        from nexios.orm import bindparam
+
+        sync_session.create_all(User)
+
+        for name in ("bind1", "bind2"):
+            sync_session.add(User(username=name, email=f"{name}@example.com", password_hash="hash"))
+        sync_session.commit()
+
+        query = select(User).where(User.username == bindparam("name"))
+        assert sync_session.exec(query.params(name="bind1")).first().username == "bind1"
+        assert sync_session.exec(query.params(name="bind2")).first().username == "bind2"
+        assert sync_session.exec(query.params(name="missing")).first() is None
+
+    def test_bind_params_operators(self, sync_session):
+        """Test bindparam() with operators other than ="""
+        from nexios.orm import bindparam
+
+        sync_session.create_all(User)
+
+        users = [User(username=f"op{i}", email=f"op{i}@example.com", password_hash="hash") for i in range(3)]
+        for user in users:
+            sync_session.add(user)
+        sync_session.commit()
+        ids = sorted(user.id for user in users)
+
+        query = select(User).where(User.id > bindparam("min_id"))
+        assert len(sync_session.exec(query.params(min_id=ids[0])).all()) >= 2
+
+        query = select(User).where(User.id.in_([bindparam("a"), bindparam("b")]))
+        found = sync_session.exec(query.params(a=ids[0], b=ids[2])).all()
+        assert sorted(user.id for user in found) == [ids[0], ids[2]]
+
+        query = select(User).where(User.id.between(bindparam("lo"), bindparam("hi")))
+        assert len(sync_session.exec(query.params(lo=ids[0], hi=ids[1])).all()) == 2
+
+        with pytest.raises(ValueError, match="IN"):
+            sync_session.exec(select(User).where(User.id.in_(bindparam("ids")))).all()
+
+        with pytest.raises(ValueError, match="LIKE"):
+            sync_session.exec(select(User).where(User.username.like(bindparam("pattern")))).all()
+
+        query = select(User).where(User.email == bindparam("email"))
+        with pytest.raises(ValueError, match="is_null"):
+            sync_session.exec(query.params(email=None)).all()
+
+    def test_in_list_mutated_after_execution(self, sync_session):
+        """Test that changing the list passed to in_() does not desync a re-executed query"""
+        sync_session.create_all(User)
+
+        users = [User(username=f"inlist{i}", email=f"inlist{i}@example.com", password_hash="hash") for i in range(3)]
+        for user in users:
+            sync_session.add(user)
+        sync_session.commit()
+
+        # The values are fixed when in_() is called, whether the list changes
+        # before or after the first execution
+        names = ["inlist0"]
+        query = select(User).where(User.username.in_(names))
+        names[0] = "inlist2"
+        assert [user.username for user in sync_session.exec(query).all()] == ["inlist0"]
+
+        names.append("inlist1")
+        assert [user.username for user in sync_session.exec(query).all()] == ["inlist0"]
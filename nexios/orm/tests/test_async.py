@@ -126,8 +126,8 @@ class TestAsyncOperations:
         # query = select(User).where(User.username == "reluser").eager_load("posts")
         query = select(User).where(User.username == "reluser").eager_load("posts")
         fetched_user = await async_session.exec(query).first()
-        fetched_posts = await async_session.exec(fetched_user.posts).all()
-        # fetched_posts = fetched_user.posts
+        # Eager loading fills the relationship with the loaded list
+        fetched_posts = fetched_user.posts
         print(f"Fetched posts======================={fetched_posts}")
 
         # Posts should be loaded
@@ -76,6 +76,22 @@ class TestCRUDOperations:
         results = sync_session.exec(query).all()
         assert len(results) == 3
 
+    def test_add_all_users(self, sync_session):
+        """Test batching inserts through add_all"""
+        sync_session.create_all(User)
+
+        users = [
+            User(id=100 + i, username=f"batch{i}", email=f"batch{i}@example.com", password_hash="hash")
+            for i in range(4)
+        ]
+        generated = User(username="generated", email="generated@example.com", password_hash="hash")
+
+        sync_session.add_all(users + [generated])
+        sync_session.commit()
+
+        assert User.count(sync_session) == 5
+        assert generated.id is not None
+
     def test_update_user(self, sync_session):
         """Test updating a user"""
         from nexios.orm.query.builder import select
@@ -231,6 +247,10 @@ class TestCRUDOperations:
         assert results[0].username == "user3"
         assert results[1].username == "user4"
 
+        # LIMIT/OFFSET are rendered inline, so non-integers are rejected
+        with pytest.raises(TypeError):
+            select(User).limit("2; DROP TABLE users")
+
     def test_count(self, sync_session):
         """Test COUNT operation"""
         from nexios.orm.query.builder import select
@@ -282,4 +302,19 @@ class TestCRUDOperations:
 
         # Should exist now
         query = select(User).where(User.username == "existsuser")
-        assert sync_session.exec(query).exists() is True
\ No newline at end of file
+        assert sync_session.exec(query).exists() is True
+
+    def test_stream(self, sync_session):
+        """Test streaming results in batches"""
+        from nexios.orm.query.builder import select
+
+        sync_session.create_all(User)
+
+        for i in range(5):
+            sync_session.add(User(username=f"stream{i}", email=f"stream{i}@example.com", password_hash="hash"))
+        sync_session.commit()
+
+        query = select(User).order_by(User.username)
+        streamed = list(sync_session.exec(query).stream(batch_size=2))
+
+        assert [u.username for u in streamed] == [f"stream{i}" for i in range(5)]
@@ -170,6 +170,69 @@ class TestRelationshipOperations:
         assert eager_user.profile.bio == "Eager bio"
         assert len(eager_user.addresses) == 2
 
+    def test_preload_relationships(self, sync_session):
+        """Test batch loading relationships for already fetched instances"""
+        sync_session.create_all(User, Address)
+
+        users = [
+            User(username=f"preload{i}", email=f"preload{i}@example.com", password_hash="hash")
+            for i in range(3)
+        ]
+        for user in users:
+            sync_session.add(user)
+        sync_session.commit()
+
+        for user in users:
+            for street in ("1 St", "2 St"):
+                sync_session.add(Address(user_id=user.id, street=street, city="City", country="Country", zip_code="12345"))
+        sync_session.commit()
+
+        fetched = sync_session.exec(select(User)).all()
+        sync_session.preload(fetched, "addresses")
+        addresses = sync_session.exec(select(Address)).all()
+        sync_session.preload(addresses, "user")
+
+        assert all(len(user.addresses) == 2 for user in fetched)
+        assert all(address.user.id == address.user_id for address in addresses)
+
+    def test_eager_loading_one_to_one(self, sync_session):
+        """Test that first(), all() and preload() load a one-to-one as a single object"""
+        sync_session.create_all(User, Profile)
+
+        user = User(username="onetoone", email="onetoone@example.com", password_hash="hash")
+        sync_session.add(user)
+        sync_session.commit()
+
+        sync_session.add(Profile(user_id=user.id, bio="Single bio", website="https://example.com"))
+        sync_session.commit()
+
+        query = select(User).where(User.id == user.id).eager_load("profile")
+        first = sync_session.exec(query).first()
+        everyone = sync_session.exec(query).all()
+        preloaded = sync_session.preload(sync_session.exec(select(User).where(User.id == user.id)).all(), "profile")
+
+        assert first.profile.bio == "Single bio"
+        assert everyone[0].profile.bio == "Single bio"
+        assert preloaded[0].profile.bio == "Single bio"
+
+    def test_nested_eager_loading(self, sync_session):
+        """Test eager loading a dotted relationship path"""
+        sync_session.create_all(User, Address)
+
+        user = User(username="nesteduser", email="nested@example.com", password_hash="hash")
+        sync_session.add(user)
+        sync_session.commit()
+
+        for street in ("1 St", "2 St"):
+            sync_session.add(Address(user_id=user.id, street=street, city="City", country="Country", zip_code="12345"))
+        sync_session.commit()
+
+        query = select(User).where(User.id == user.id).eager_load("addresses.user")
+        fetched = sync_session.exec(query).first()
+
+        assert len(fetched.addresses) == 2
+        assert all(address.user.id == user.id for address in fetched.addresses)
+
     def test_lazy_loading_strategies(self, sync_session):
         """Test different lazy loading strategies"""
         sync_session.create_all(User, Post)
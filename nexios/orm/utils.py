@@ -1,5 +1,6 @@
 from __future__ import annotations
 import re
+import sys
 from typing import Literal, Optional, TypeVar, Any, Type, Union, Dict
 from packaging import version
 from pydantic import ConfigDict, BaseModel as PydanticBaseModel
@@ -48,17 +49,17 @@ def set_config_value(
 
 
 def get_tablename_for_class(cls: Any) -> Optional[str]:
-    if hasattr(cls, "__tablename__") and cls.__tablename__ is not None:
-        return cls.__tablename__
-
-    table = get_config_value(model=cls, parameter="table", default=False)
-    if table is True and (hasattr(cls, "model_config") or hasattr(cls, '__config__')):
-        tablename = (
-            f"{cls.__name__.lower()}" if cls.__name__.lower().endswith('s')
-            else f"{cls.__name__.lower()}s"
-        )
+    tablename = getattr(cls, "__tablename__", None)
+    if tablename is not None:
         return tablename
 
+    # get_config_value reads model_config/__config__, so reaching True here
+    # already implies the class carries a config
+    if get_config_value(model=cls, parameter="table", default=False) is True:
+        name = cls.__name__.lower()
+        # Derived names are built at runtime; intern them like identifiers
+        return sys.intern(name if name.endswith('s') else f"{name}s")
+
     return None
 
 def get_model_fields(
@@ -74,7 +75,4 @@ def get_tablename(model_class: InstanceOrType[Any]) -> str:
     if not isinstance(model_class, type):
         model_class = model_class.__class__
 
-    tablename = getattr(model_class, "__tablename__", None)
-    if tablename is None and hasattr(model_class, "__tablename__"):
-        tablename = model_class.__tablename__
-    return tablename if tablename else ""
\ No newline at end of file
+    return getattr(model_class, "__tablename__", None) or ""
\ No newline at end of file
@@ -1,11 +1,14 @@
 import os
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from nexios.http import Request, Response
+from nexios.http.response import FileResponse
 from nexios.routing import BaseRouter
 from nexios.types import Receive, Scope, Send
 
+_RESOLVED_CACHE_SIZE = 4096
+
 
 class StaticFiles(BaseRouter):
     def __init__(
@@ -15,15 +18,28 @@ class StaticFiles(BaseRouter):
         allowed_extensions: Optional[List[str]] = None,
         custom_404_handler: Optional[Callable[[Request, Response], Any]] = None,
         cache_control: Optional[str] = None,
+        cache_lookups: bool = True,
     ):
         if not directories:
             directories = [directory] if directory else []
         self.directories = [self._ensure_directory(d) for d in directories or []]
+        # Resolved roots with a trailing separator, so "/static" does not
+        # also admit "/static-private"
+        self._directory_prefixes = tuple(
+            os.path.join(str(d), "") for d in self.directories
+        )
         self.allowed_extensions = set(
             ext.lower().lstrip(".") for ext in (allowed_extensions or [])
         )
         self.custom_404_handler = custom_404_handler
         self.cache_control = cache_control
+        # With cache_lookups, served files are remembered by request path so
+        # repeat hits skip searching the directories (the cached file is
+        # still re-checked). Misses are not cached, so files added later are
+        # still found. Turn it off for trees whose files move between served
+        # directories while the app runs.
+        self.cache_lookups = cache_lookups
+        self._resolved: Dict[str, str] = {}
 
     def _ensure_directory(self, path: Union[str, Path]) -> Path:
         """Ensure directory exists and return resolved Path"""
@@ -34,41 +50,61 @@ class StaticFiles(BaseRouter):
             raise ValueError(f"{directory} is not a directory")
         return directory
 
-    def _is_safe_path(self, path: Path) -> bool:
-        """Check if the path is safe to serve"""
-        try:
-            full_path = path.resolve()
-            return any(
-                str(full_path).startswith(str(directory))
-                for directory in self.directories
-            )
-        except (ValueError, RuntimeError):
-            return False
+    def _is_safe_path(self, path: Union[str, Path]) -> bool:
+        """Check if an already resolved path lies inside a served directory"""
+        return str(path).startswith(self._directory_prefixes)
 
-    def _is_extension_allowed(self, file_path: Path) -> bool:
+    def _is_extension_allowed(self, file_path: Union[str, Path]) -> bool:
         """Check if the file extension is in the allowed list"""
         if not self.allowed_extensions:
             return True
-        return file_path.suffix.lower().lstrip(".") in self.allowed_extensions
+        suffix = os.path.splitext(file_path)[1]
+        return suffix.lower().lstrip(".") in self.allowed_extensions
+
+    def _is_servable(self, file_path: str) -> bool:
+        """Check a resolved path is a permitted file inside a served directory"""
+        return (
+            self._is_safe_path(file_path)
+            and os.path.isfile(file_path)
+            and self._is_extension_allowed(file_path)
+        )
+
+    def _resolve(self, path: str) -> Optional[str]:
+        """Return the file to serve for a request path, or None"""
+        cached = self._resolved.get(path)
+        if cached is not None:
+            # The cache only saves the walk over the directories; the file
+            # may since have been deleted or replaced by a symlink, so it is
+            # resolved and checked again like a fresh lookup
+            file_path = os.path.realpath(cached)
+            if self._is_servable(file_path):
+                return file_path
+            del self._resolved[path]
+        for directory in self._directory_prefixes:
+            try:
+                # realpath still follows symlinks, so links pointing out of
+                # the directory are rejected by the prefix check
+                file_path = os.path.realpath(os.path.join(directory, path))
+            except (ValueError, RuntimeError):
+                continue
+            if self._is_servable(file_path):
+                if self.cache_lookups:
+                    if len(self._resolved) >= _RESOLVED_CACHE_SIZE:
+                        del self._resolved[next(iter(self._resolved))]
+                    self._resolved[path] = file_path
+                return file_path
+        return None
 
     async def _handle(self, request: Request, response: Response):
         path = request.scope.get("path", "").lstrip("/")
         if request.method != "GET":
             return response.json("Method not allowed", status_code=405)
-        for directory in self.directories:
-            try:
-                file_path = (directory / path).resolve()
-                if (
-                    self._is_safe_path(file_path)
-                    and file_path.is_file()
-                    and self._is_extension_allowed(file_path)
-                ):
-                    response.file(str(file_path), content_disposition_type="inline")
-                    if self.cache_control:
-                        response.set_header("cache-control", self.cache_control)
-                    return response
-            except (ValueError, RuntimeError):
-                continue
+        file_path = self._resolve(path)
+        if file_path is not None:
+            response.file(file_path, content_disposition_type="inline")
+            if self.cache_control:
+                response.set_header("cache-control", self.cache_control)
+            return response
 
         # Use custom 404 handler if provided, otherwise use default
         if self.custom_404_handler:
@@ -77,6 +113,19 @@ class StaticFiles(BaseRouter):
             return response.json("Resource not found", status_code=404)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Hits go straight to a FileResponse; only misses and other methods
+        # need the Request/Response wrappers
+        if scope.get("method") == "GET":
+            file_path = self._resolve(scope.get("path", "").lstrip("/"))
+            if file_path is not None:
+                file_response = FileResponse(
+                    file_path, content_disposition_type="inline"
+                )
+                if self.cache_control:
+                    file_response.set_header("cache-control", self.cache_control)
+                await file_response(scope, receive, send)
+                return
+
         request = Request(scope, receive)
         response = Response(request)
 
@@ -2,6 +2,7 @@
 Template context middleware for Nexios.
 """
 
+from collections import ChainMap
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 from nexios.middleware import BaseMiddleware
@@ -20,6 +21,9 @@ class TemplateContextMiddleware(BaseMiddleware):
         """Initialize middleware with context."""
         self.default_context = default_context or {}
         self.context_processor = context_processor
+        self._processor_is_async = bool(context_processor) and is_async_callable(
+            context_processor
+        )
 
     async def __call__(
         self,
@@ -28,24 +32,25 @@ class TemplateContextMiddleware(BaseMiddleware):
         call_next: Callable[..., Awaitable[Any]],
     ) -> Response:
         """Process request and inject context."""
-        context = self.default_context.copy()
-
-        if self.context_processor:
-            if not is_async_callable(self.context_processor):
-                request_context = self.context_processor(request)
-            else:
-                request_context = await self.context_processor(request)
-            context.update(request_context)  # ty :ignore[no-matching-overload]
-
-        context.update(
+        # Layered lookup instead of copying default_context on every request;
+        # earlier maps win, matching the old update order
+        maps = [
             {
                 "request": request,
                 "url_for": request.base_app.url_for,
                 "csrf_token": request.state.csrf_token,
             }
-        )
+        ]
+
+        if self.context_processor:
+            if self._processor_is_async:
+                request_context = await self.context_processor(request)
+            else:
+                request_context = self.context_processor(request)
+            maps.append(request_context)
 
-        request.state.template_context = context
+        maps.append(self.default_context)
+        request.state.template_context = ChainMap(*maps)
         return await call_next()
 
 
@@ -1,21 +1,23 @@
 import asyncio
 import functools
+import os
+import threading
 import warnings
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import asynccontextmanager
 from typing import (
     Any,
-    AsyncGenerator,
     Awaitable,
     Callable,
     Coroutine,
     Generic,
+    Iterable,
     List,
     Optional,
     Set,
     TypeVar,
 )
-task_group = asyncio.TaskGroup
+# Native structured-concurrency group, None before Python 3.11
+task_group = getattr(asyncio, "TaskGroup", None)
 
 import anyio
 
@@ -25,26 +27,51 @@ T = TypeVar("T")
 class TaskGroup:
     """A group of tasks that can be managed together."""
 
+    __slots__ = ("tasks", "_closed", "_prune_at")
+
     def __init__(self):
         self.tasks: Set[asyncio.Task] = set()
         self._closed = False
+        self._prune_at = 64
 
     def create_task(self, coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
         """Create a task in this group."""
         if self._closed:
             raise RuntimeError("TaskGroup is closed")
         task = asyncio.create_task(coro)
+        self._prune()
         self.tasks.add(task)
-        task.add_done_callback(self.tasks.discard)
         return task
 
+    def create_tasks(self, coros: Iterable[Coroutine[Any, Any, T]]) -> List[asyncio.Task[T]]:
+        """Create a task in this group for each coroutine."""
+        if self._closed:
+            raise RuntimeError("TaskGroup is closed")
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        self._prune()
+        self.tasks.update(tasks)
+        return tasks
+
+    def _prune(self) -> None:
+        # Finished tasks are swept out whenever the set doubles instead of
+        # through a done-callback on every task
+        if len(self.tasks) >= self._prune_at:
+            self.tasks = {t for t in self.tasks if not t.done()}
+            self._prune_at = max(64, len(self.tasks) * 2)
+
     async def cancel_all(self) -> None:
         """Cancel all tasks in the group."""
+        pending = [task for task in self.tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Only the cancelled tasks need draining; asyncio.wait does not
+            # build a result list the way gather() does
+            await asyncio.wait(pending)
         for task in self.tasks:
-            if not task.done():
-                task.cancel()
-        if self.tasks:
-            await asyncio.gather(*self.tasks, return_exceptions=True)
+            # Mark failures as retrieved so they are not logged at GC
+            if not task.cancelled():
+                task.exception()
         self.tasks.clear()
         self._closed = True
 
@@ -55,22 +82,33 @@ class TaskGroup:
         await self.cancel_all()
 
 
-@asynccontextmanager
-async def create_task_group() -> AsyncGenerator[TaskGroup, None]:
+def create_task_group() -> TaskGroup:
     """Create a task group context manager."""
-    async with TaskGroup() as group:
-        yield group
+    # TaskGroup is already an async context manager, so no generator wrapper
+    return TaskGroup()
 
 
 _threadpool: Optional[ThreadPoolExecutor] = None
+_threadpool_lock = threading.Lock()
 
 
 def get_threadpool() -> ThreadPoolExecutor:
     """Get the global threadpool executor."""
     global _threadpool
-    if _threadpool is None:
-        _threadpool = ThreadPoolExecutor()
-    return _threadpool
+    threadpool = _threadpool
+    if threadpool is not None:
+        return threadpool
+    # May be first called from several threads at once; only one may
+    # create the executor
+    with _threadpool_lock:
+        if _threadpool is None:
+            # Handlers offloaded here are mostly blocking I/O, so allow more
+            # workers than the CPU-oriented default of cpu_count() + 4
+            _threadpool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 5),
+                thread_name_prefix="nexios-threadpool",
+            )
+        return _threadpool
 
 
 async def run_in_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -78,7 +116,7 @@ async def run_in_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -
     loop = asyncio.get_running_loop()
     if kwargs:
         func = functools.partial(func, **kwargs)
-    return await loop.run_in_executor(get_threadpool(), func, *args)
+    return await loop.run_in_executor(_threadpool or get_threadpool(), func, *args)
 
 
 async def run_until_first_complete(*args: tuple[Callable, dict]) -> None:  # type: ignore[type-arg]
@@ -120,7 +158,7 @@ class AsyncLazy(Generic[T]):
     Attributes:
         func: The async function that computes the value
         _value: The cached computed value (None if not computed yet)
-        _lock: Async lock for thread-safe initialization
+        _lock: Async lock for thread-safe initialization (created on first get)
         _initialized: Flag indicating if the value has been computed
 
     Example:
@@ -144,6 +182,8 @@ class AsyncLazy(Generic[T]):
         ```
     """
 
+    __slots__ = ("func", "_value", "_lock", "_initialized")
+
     def __init__(self, func: Callable[[], Awaitable[T]]):
         """Initialize AsyncLazy with an async function.
 
@@ -164,7 +204,8 @@ class AsyncLazy(Generic[T]):
         """
         self.func = func
         self._value: Optional[T] = None
-        self._lock = asyncio.Lock()
+        # Created by the first get(), so instances never read skip it
+        self._lock: Optional[asyncio.Lock] = None
         self._initialized = False
 
     async def get(self) -> T:
@@ -192,13 +233,18 @@ class AsyncLazy(Generic[T]):
             assert result1 is result2  # Same cached object
             ```
         """
-        if not self._initialized:
-            async with self._lock:
-                if not self._initialized:
-                    self._value = await self.func()
-                    self._initialized = True
-        assert self._value is not None
-        return self._value
+        if self._initialized:
+            return self._value  # type: ignore[return-value]
+        if self._lock is None:
+            # No await since the check, so concurrent callers share one lock
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._initialized:
+                # Publish the value before the flag so the lock-free check
+                # above never sees a half-initialized state
+                self._value = await self.func()
+                self._initialized = True
+        return self._value  # type: ignore[return-value]
 
     def reset(self) -> None:
         """Reset the value so it will be recomputed next time.
@@ -247,34 +293,20 @@ class AsyncEvent:
         ```
     """
 
+    __slots__ = ("_event",)
+
     def __init__(self):
         """Create a new AsyncEvent in cleared state."""
-        self._waiters: List[asyncio.Future] = []
-        self._value = False
+        self._event = asyncio.Event()
 
     def set(self) -> None:
         """Set the event and wake up all waiting coroutines."""
-        self._value = True
-        for waiter in self._waiters:
-            if not waiter.done():
-                waiter.set_result(True)
-        self._waiters.clear()
+        self._event.set()
 
     def clear(self) -> None:
         """Clear the event so future wait() calls will block."""
-        self._value = False
+        self._event.clear()
 
     async def wait(self) -> bool:
         """Wait for the event to be set. Returns True when event occurs."""
-        if self._value:
-            return True
-        waiter = asyncio.Future()
-        self._waiters.append(waiter)
-        try:
-            await waiter
-        finally:
-            try:
-                self._waiters.remove(waiter)
-            except ValueError:
-                pass
-        return True
+        return await self._event.wait()
@@ -41,6 +41,14 @@ async def test_task_group_error_propagation():
             await task2
 
 
+async def test_task_group_create_tasks():
+    async with TaskGroup() as group:
+        tasks = group.create_tasks(asyncio.sleep(0.01, result=i) for i in range(3))
+        results = await asyncio.gather(*tasks)
+
+    assert results == [0, 1, 2]
+
+
 async def raise_error():
     raise ValueError("Test error")
 
@@ -157,6 +165,21 @@ async def test_async_lazy_concurrent_access():
     assert counter == 1
 
 
+async def test_async_lazy_caches_none():
+    counter = 0
+
+    async def returns_none():
+        nonlocal counter
+        counter += 1
+        return None
+
+    lazy = AsyncLazy(returns_none)
+
+    assert await lazy.get() is None
+    assert await lazy.get() is None
+    assert counter == 1
+
+
 async def test_combined_utilities():
     results = []
 
@@ -302,3 +302,76 @@ def test_static_file_empty_extension_list():
 
         resp = client.get("/static/script.js")
         assert resp.status_code == 200
+
+
+def test_static_file_sibling_directory_not_served(tmp_path):
+    """Test that a directory sharing the served root's prefix is rejected"""
+    public = tmp_path / "site"
+    private = tmp_path / "site-private"
+    private.mkdir()
+    (private / "secret.txt").write_text("secret")
+
+    static_files = StaticFiles(directory=public)
+
+    assert static_files._is_safe_path(str(public.resolve() / "index.html"))
+    assert not static_files._is_safe_path(str(private.resolve() / "secret.txt"))
+
+
+def test_static_file_lookup_cache():
+    """Test that served paths are cached and misses are not"""
+    app = NexiosApp()
+    static_dir = Path(__file__).parent / "static"
+    static_files = StaticFiles(directory=static_dir)
+    uncached_files = StaticFiles(directory=static_dir, cache_lookups=False)
+    app.add_route(Group(path="/static", app=static_files))
+    app.add_route(Group(path="/uncached", app=uncached_files))
+
+    with TestClient(app) as client:
+        assert client.get("/static/example.txt").status_code == 200
+        assert client.get("/static/example.txt").status_code == 200
+        assert client.get("/static/doesnotexist.txt").status_code == 404
+        assert client.get("/uncached/example.txt").status_code == 200
+
+    assert list(static_files._resolved) == ["example.txt"]
+    assert uncached_files._resolved == {}
+
+
+def test_static_file_cached_then_deleted(tmp_path):
+    """Test that a cached file returns 404 once it has been deleted"""
+    (tmp_path / "gone.txt").write_text("soon gone")
+
+    app = NexiosApp()
+    static_files = StaticFiles(directory=tmp_path)
+    app.add_route(Group(path="/static", app=static_files))
+
+    with TestClient(app) as client:
+        assert client.get("/static/gone.txt").status_code == 200
+        assert "gone.txt" in static_files._resolved
+
+        (tmp_path / "gone.txt").unlink()
+
+        assert client.get("/static/gone.txt").status_code == 404
+        assert "gone.txt" not in static_files._resolved
+
+
+def test_static_file_cached_then_symlinked_outside(tmp_path):
+    """Test that a cached file replaced by a symlink out of the directory is not served"""
+    public = tmp_path / "public"
+    public.mkdir()
+    (public / "note.txt").write_text("public note")
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+
+    app = NexiosApp()
+    static_files = StaticFiles(directory=public)
+    app.add_route(Group(path="/static", app=static_files))
+
+    with TestClient(app) as client:
+        assert client.get("/static/note.txt").status_code == 200
+
+        (public / "note.txt").unlink()
+        (public / "note.txt").symlink_to(outside)
+
+        resp = client.get("/static/note.txt")
+        assert resp.status_code == 404
+        assert b"secret" not in resp.content